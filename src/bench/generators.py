@@ -0,0 +1,541 @@
+import json
+import math
+import random
+import re
+import string
+from typing import Callable, Iterator
+
+import day25
+
+# Every generator takes a seeded Random and a scale factor and returns the text
+# of a valid puzzle input roughly `scale` times the size of data/dayN.txt.
+
+
+def _side(base: int, scale: int) -> int:
+    # grids grow in area, so the side grows with the square root of the scale
+    return max(2, round(base * math.sqrt(scale)))
+
+
+def _day1(rng: random.Random, scale: int) -> str:
+    groups = []
+
+    for _ in range(250 * scale):
+        items = [str(rng.randint(1000, 60000)) for _ in range(rng.randint(1, 15))]
+        groups.append("\n".join(items))
+
+    return "\n\n".join(groups) + "\n"
+
+
+def _day2(rng: random.Random, scale: int) -> str:
+    lines = [f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(2500 * scale)]
+    return "\n".join(lines) + "\n"
+
+
+def _day3(rng: random.Random, scale: int) -> str:
+    lines = []
+
+    for _ in range(100 * scale):
+        # each elf of a group draws from its own pool, so only the badge is
+        # common to the whole group
+        badge, *rest = rng.sample(string.ascii_letters, 52)
+
+        for i in range(3):
+            pool = rest[i * 17 : (i + 1) * 17]
+            left_pool, right_pool = pool[:8], pool[8:]
+            shared = rng.choice(pool + [badge])
+            half = rng.randint(8, 16)
+
+            left = [rng.choice(left_pool) for _ in range(half - 2)] + [shared, badge]
+            right = [rng.choice(right_pool) for _ in range(half - 1)] + [shared]
+            rng.shuffle(left)
+            rng.shuffle(right)
+            lines.append("".join(left + right))
+
+    return "\n".join(lines) + "\n"
+
+
+def _day4(rng: random.Random, scale: int) -> str:
+    lines = []
+
+    for _ in range(1000 * scale):
+        a, b = sorted(rng.randint(1, 99) for _ in range(2))
+        c, d = sorted(rng.randint(1, 99) for _ in range(2))
+        lines.append(f"{a}-{b},{c}-{d}")
+
+    return "\n".join(lines) + "\n"
+
+
+def _day5(rng: random.Random, scale: int) -> str:
+    num_of_stacks = 9
+    stacks = [
+        [rng.choice(string.ascii_uppercase) for _ in range(rng.randint(1, 8))]
+        for _ in range(num_of_stacks)
+    ]
+
+    lines = []
+    for level in range(max(len(stack) for stack in stacks) - 1, -1, -1):
+        cells = [f"[{s[level]}]" if level < len(s) else "   " for s in stacks]
+        lines.append(" ".join(cells))
+    lines.append(" " + "   ".join(str(i + 1) for i in range(num_of_stacks)) + " ")
+    lines.append("")
+
+    # never empty a stack, part1 and part2 read the top of each one
+    sizes = [len(stack) for stack in stacks]
+    for _ in range(500 * scale):
+        from_stack = rng.choice([i for i, size in enumerate(sizes) if size > 1])
+        to_stack = rng.choice([i for i in range(num_of_stacks) if i != from_stack])
+        num = rng.randint(1, min(sizes[from_stack] - 1, 10))
+        sizes[from_stack] -= num
+        sizes[to_stack] += num
+        lines.append(f"move {num} from {from_stack + 1} to {to_stack + 1}")
+
+    return "\n".join(lines) + "\n"
+
+
+def _day6(rng: random.Random, scale: int) -> str:
+    text = [rng.choice(string.ascii_lowercase) for _ in range(4095 * scale)]
+    # make sure both markers exist
+    text[-15:-1] = rng.sample(string.ascii_lowercase, 14)
+    return "".join(text)
+
+
+def _day7(rng: random.Random, scale: int) -> str:
+    num_of_dirs = 150 * scale
+    children: list[list[int]] = [[] for _ in range(num_of_dirs)]
+
+    # random recursive tree, expected depth is logarithmic
+    for i in range(1, num_of_dirs):
+        children[rng.randrange(i)].append(i)
+
+    lines = ["$ cd /"]
+    stack: list[tuple[int, bool]] = [(0, True)]
+
+    while stack:
+        directory, entering = stack.pop()
+
+        if not entering:
+            lines.append("$ cd ..")
+            continue
+
+        if directory != 0:
+            lines.append(f"$ cd d{directory}")
+
+        lines.append("$ ls")
+        for child in children[directory]:
+            lines.append(f"dir d{child}")
+        for i in range(rng.randint(0, 5)):
+            lines.append(f"{rng.randint(1000, 300000)} f{i}.txt")
+
+        for child in reversed(children[directory]):
+            stack.append((child, False))
+            stack.append((child, True))
+
+    return "\n".join(lines) + "\n"
+
+
+def _day8(rng: random.Random, scale: int) -> str:
+    side = _side(99, scale)
+    lines = [
+        "".join(rng.choice(string.digits) for _ in range(side)) for _ in range(side)
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _day9(rng: random.Random, scale: int) -> str:
+    lines = [f"{rng.choice('UDLR')} {rng.randint(1, 19)}" for _ in range(2000 * scale)]
+    return "\n".join(lines) + "\n"
+
+
+def _day10(rng: random.Random, scale: int) -> str:
+    lines: list[str] = []
+    cycles = 0
+
+    # part2 draws 240 pixels
+    while len(lines) < 143 * scale or cycles < 241:
+        if rng.random() < 0.7:
+            lines.append(f"addx {rng.randint(-20, 20)}")
+            cycles += 2
+        else:
+            lines.append("noop")
+            cycles += 1
+
+    return "\n".join(lines) + "\n"
+
+
+def _day11(rng: random.Random, scale: int) -> str:
+    num_of_monkeys = 8
+    primes = rng.sample([2, 3, 5, 7, 11, 13, 17, 19, 23], num_of_monkeys)
+    squaring = rng.randrange(num_of_monkeys)
+    monkeys = []
+
+    for i, prime in enumerate(primes):
+        items = [str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8) * scale)]
+
+        if i == squaring:
+            operation = "old * old"
+        else:
+            operation = f"old {rng.choice('+*')} {rng.randint(1, 8)}"
+
+        t_throw, f_throw = rng.sample([j for j in range(num_of_monkeys) if j != i], 2)
+
+        monkeys.append(
+            f"Monkey {i}:\n"
+            f"  Starting items: {', '.join(items)}\n"
+            f"  Operation: new = {operation}\n"
+            f"  Test: divisible by {prime}\n"
+            f"    If true: throw to monkey {t_throw}\n"
+            f"    If false: throw to monkey {f_throw}\n"
+        )
+
+    return "\n".join(monkeys)
+
+
+def _day12(rng: random.Random, scale: int) -> str:
+    rows, cols = _side(41, scale), _side(171, scale)
+    lines = []
+
+    for _ in range(rows):
+        # the height grows from west to east with small dips along the way
+        heights = [
+            max(0, 26 * col // cols - rng.choice([0, 0, 0, 1])) for col in range(cols)
+        ]
+        lines.append([chr(ord("a") + h) for h in heights])
+
+    lines[rng.randrange(rows)][0] = "S"
+    lines[rng.randrange(rows)][cols - 1] = "E"
+
+    return "\n".join("".join(line) for line in lines) + "\n"
+
+
+def _packet(rng: random.Random, depth: int) -> list:
+    packet: list = []
+
+    for _ in range(rng.randint(0, 5)):
+        if depth < 4 and rng.random() < 0.3:
+            packet.append(_packet(rng, depth + 1))
+        else:
+            packet.append(rng.randint(0, 10))
+
+    return packet
+
+
+def _day13(rng: random.Random, scale: int) -> str:
+    pairs = []
+
+    for _ in range(150 * scale):
+        first, second = (_packet(rng, 0) for _ in range(2))
+        pairs.append(
+            json.dumps(first, separators=(",", ":"))
+            + "\n"
+            + json.dumps(second, separators=(",", ":"))
+        )
+
+    return "\n\n".join(pairs) + "\n"
+
+
+def _day14(rng: random.Random, scale: int) -> str:
+    depth = _side(170, scale)
+    lines = []
+
+    for _ in range(164 * scale):
+        x, y = rng.randint(500 - depth // 2, 500 + depth // 2), rng.randint(10, depth)
+        positions = [f"{x},{y}"]
+
+        for segment in range(rng.randint(1, 6)):
+            length = rng.randint(1, 8)
+            if segment % 2 == 0:
+                x += rng.choice([-length, length])
+            else:
+                y = min(depth, max(10, y + rng.choice([-length, length])))
+            positions.append(f"{x},{y}")
+
+        lines.append(" -> ".join(positions))
+
+    return "\n".join(lines) + "\n"
+
+
+def _sensor_line(sensor: tuple[int, int], radius: int) -> str:
+    x, y = sensor
+    return f"Sensor at x={x}, y={y}: closest beacon is at x={x + radius}, y={y}"
+
+
+def _day15(rng: random.Random, scale: int) -> str:
+    size = 4_000_000
+    per_side = max(1, round(math.sqrt(28 * scale)) - 1)
+    spacing = size // per_side
+    hidden = (rng.randint(0, size), rng.randint(0, size))
+    lines = []
+
+    # a lattice of sensors covers the whole square; the ones that would cover
+    # the hidden beacon are shrunk to stop just short of it
+    for i in range(per_side + 2):
+        for j in range(per_side + 2):
+            sensor = (i * spacing, j * spacing)
+            distance = abs(sensor[0] - hidden[0]) + abs(sensor[1] - hidden[1])
+
+            if distance > spacing:
+                lines.append(_sensor_line(sensor, spacing))
+            elif distance > 0:
+                lines.append(_sensor_line(sensor, distance - 1))
+
+    # four diagonal sensors cover everything near the hidden beacon but itself
+    offset = 2 * spacing
+    for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
+        sensor = (hidden[0] + dx * offset, hidden[1] + dy * offset)
+        lines.append(_sensor_line(sensor, 2 * offset - 1))
+
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+def _valve_name(idx: int) -> str:
+    name = ""
+
+    while idx or len(name) < 2:
+        idx, rem = divmod(idx, 26)
+        name = string.ascii_uppercase[rem] + name
+
+    return name
+
+
+def _day16(rng: random.Random, scale: int) -> str:
+    num_of_valves = 10 * scale
+    names = [_valve_name(i) for i in range(num_of_valves)]
+    tunnels: list[set[int]] = [set() for _ in range(num_of_valves)]
+
+    # a random spanning tree keeps everything reachable, plus a few shortcuts
+    for i in range(1, num_of_valves):
+        j = rng.randrange(i)
+        tunnels[i].add(j)
+        tunnels[j].add(i)
+
+    for _ in range(num_of_valves // 4):
+        i, j = rng.sample(range(num_of_valves), 2)
+        tunnels[i].add(j)
+        tunnels[j].add(i)
+
+    lines = []
+    for i, name in enumerate(names):
+        rate = 0 if i == 0 or rng.random() < 0.4 else rng.randint(1, 25)
+        targets = ", ".join(names[j] for j in sorted(tunnels[i]))
+        lines.append(
+            f"Valve {name} has flow rate={rate}; tunnels lead to valves {targets}"
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+def _day17(rng: random.Random, scale: int) -> str:
+    return "".join(rng.choice("<>") for _ in range(10091 * scale)) + "\n"
+
+
+def _day18(rng: random.Random, scale: int) -> str:
+    num_of_cubes = 2165 * scale
+    # a ball of roughly 40% density, as in the real droplet
+    radius = math.ceil((3 * num_of_cubes / (4 * math.pi * 0.4)) ** (1 / 3))
+    cubes: set[tuple[int, int, int]] = set()
+
+    while len(cubes) < num_of_cubes:
+        x, y, z = (rng.randint(-radius, radius) for _ in range(3))
+        if x * x + y * y + z * z <= radius * radius:
+            cubes.add((x + radius, y + radius, z + radius))
+
+    return "\n".join(f"{x},{y},{z}" for x, y, z in cubes) + "\n"
+
+
+def _day19(rng: random.Random, scale: int) -> str:
+    lines = []
+
+    for idx in range(1, 3 * scale + 1):
+        lines.append(
+            f"Blueprint {idx}: "
+            f"Each ore robot costs {rng.randint(2, 4)} ore. "
+            f"Each clay robot costs {rng.randint(2, 4)} ore. "
+            f"Each obsidian robot costs {rng.randint(2, 4)} ore "
+            f"and {rng.randint(5, 20)} clay. "
+            f"Each geode robot costs {rng.randint(2, 4)} ore "
+            f"and {rng.randint(5, 20)} obsidian."
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+def _day20(rng: random.Random, scale: int) -> str:
+    numbers = [rng.choice([-1, 1]) * rng.randint(1, 10000) for _ in range(5000 * scale)]
+    numbers[rng.randrange(len(numbers))] = 0
+    return "\n".join(map(str, numbers)) + "\n"
+
+
+def _monkey_name(idx: int) -> str:
+    name = ""
+
+    for _ in range(5):
+        idx, rem = divmod(idx, 26)
+        name += string.ascii_lowercase[rem]
+
+    return name
+
+
+def _split_value(rng: random.Random, value: int) -> tuple[int, str, int]:
+    # every node value stays non-zero and every division stays exact, so the
+    # equation of part2 can be inverted with integer arithmetic
+    divisors = [d for d in (2, 3, 5, 7) if value % d == 0]
+    op = rng.choice("+-*/" if divisors else "+-/")
+
+    if op == "+":
+        left = rng.randint(1, max(2, abs(value)))
+        if left == value:
+            left += 1
+        return left, op, value - left
+
+    if op == "-":
+        right = rng.randint(1, 100)
+        if value + right == 0:
+            right += 1
+        return value + right, op, right
+
+    if op == "*":
+        right = rng.choice(divisors)
+        return value // right, op, right
+
+    right = rng.randint(2, 10)
+    return value * right, op, right
+
+
+def _monkey_lines(
+    rng: random.Random,
+    names: Iterator[str],
+    stack: list[tuple[str, int, int]],
+) -> tuple[list[str], list[str]]:
+    # entries are (name, value, number of leaves below); leaf names are
+    # returned in depth-first order
+    lines = []
+    leaves = []
+
+    while stack:
+        name, value, size = stack.pop()
+
+        if size == 1:
+            lines.append(f"{name}: {value}")
+            leaves.append(name)
+            continue
+
+        left_value, op, right_value = _split_value(rng, value)
+        left_size = rng.randint(1, size - 1)
+        left, right = next(names), next(names)
+        lines.append(f"{name}: {left} {op} {right}")
+        stack.append((right, right_value, size - left_size))
+        stack.append((left, left_value, left_size))
+
+    return lines, leaves
+
+
+def _day21(rng: random.Random, scale: int) -> str:
+    num_of_leaves = 839 * scale
+    human = rng.randrange(num_of_leaves)
+    names = iter(_monkey_name(i) for i in range(2 * num_of_leaves))
+
+    value = rng.randint(1, 10**6)
+    left_size = rng.randint(1, num_of_leaves - 1)
+    left, right = next(names), next(names)
+    stack = [(left, value, left_size), (right, value, num_of_leaves - left_size)]
+
+    lines, leaves = _monkey_lines(rng, names, stack)
+    human_name = leaves[human]
+    lines.insert(0, f"root: {left} + {right}")
+
+    rng.shuffle(lines)
+    return re.sub(rf"\b{human_name}\b", "humn", "\n".join(lines)) + "\n"
+
+
+def _day22(rng: random.Random, scale: int) -> str:
+    side = _side(50, scale)
+    # the cube net hard-wired into day22.CubeCorrector
+    faces = {(0, 1), (0, 2), (1, 1), (2, 0), (2, 1), (3, 0)}
+    lines = []
+
+    for row in range(4 * side):
+        line = ""
+        for face_col in range(3):
+            if (row // side, face_col) in faces:
+                line += "".join(
+                    "#" if rng.random() < 0.1 else "." for _ in range(side)
+                )
+            elif any(face[0] == row // side and face[1] > face_col for face in faces):
+                line += " " * side
+        lines.append(line)
+
+    # the walk starts in the top left corner of the first face
+    lines[0] = " " * side + "." + lines[0][side + 1 :]
+
+    instructions = [str(rng.randint(1, 50))]
+    for _ in range(2000 * scale):
+        instructions.append(rng.choice("LR"))
+        instructions.append(str(rng.randint(1, 50)))
+
+    return "\n".join(lines) + "\n\n" + "".join(instructions) + "\n"
+
+
+def _day23(rng: random.Random, scale: int) -> str:
+    side = _side(72, scale)
+    lines = [
+        "".join("#" if rng.random() < 0.5 else "." for _ in range(side))
+        for _ in range(side)
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _day24(rng: random.Random, scale: int) -> str:
+    rows, cols = _side(25, scale), _side(120, scale)
+    lines = ["#." + "#" * cols]
+
+    for _ in range(rows):
+        cells = []
+        for col in range(cols):
+            # no vertical blizzards in the entrance and exit columns
+            choices = "<>" if col in (0, cols - 1) else "<>^v"
+            cells.append(rng.choice(choices) if rng.random() < 0.75 else ".")
+        lines.append("#" + "".join(cells) + "#")
+
+    lines.append("#" * cols + ".#")
+    return "\n".join(lines) + "\n"
+
+
+def _day25(rng: random.Random, scale: int) -> str:
+    numbers = [rng.randint(1, 10**12) for _ in range(108 * scale)]
+    return "\n".join(day25.snafu_encode(number) for number in numbers) + "\n"
+
+
+GENERATORS: dict[int, Callable[[random.Random, int], str]] = {
+    1: _day1,
+    2: _day2,
+    3: _day3,
+    4: _day4,
+    5: _day5,
+    6: _day6,
+    7: _day7,
+    8: _day8,
+    9: _day9,
+    10: _day10,
+    11: _day11,
+    12: _day12,
+    13: _day13,
+    14: _day14,
+    15: _day15,
+    16: _day16,
+    17: _day17,
+    18: _day18,
+    19: _day19,
+    20: _day20,
+    21: _day21,
+    22: _day22,
+    23: _day23,
+    24: _day24,
+    25: _day25,
+}
+
+SCALES = (1, 10, 100, 1000)
+
+
+def generate(day: int, scale: int = 1, seed: int = 0) -> str:
+    return GENERATORS[day](random.Random(f"{day}:{scale}:{seed}"), scale)
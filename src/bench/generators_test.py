@@ -0,0 +1,43 @@
+import re
+
+import day5
+import day15
+import day21
+from bench.generators import GENERATORS, generate
+from inputs import BytesSource
+
+
+def source(day: int, scale: int = 1) -> BytesSource:
+    return BytesSource(generate(day, scale).encode())
+
+
+def test_deterministic() -> None:
+    for day in GENERATORS:
+        assert generate(day, seed=1) == generate(day, seed=1)
+    assert generate(1, seed=1) != generate(1, seed=2)
+
+
+def test_scaled_size() -> None:
+    assert 8 < len(generate(20, 10)) / len(generate(20, 1)) < 12
+
+
+def test_day5_stacks() -> None:
+    assert len(day5.part1(source(5))) == 9
+
+
+def test_day15_single_gap() -> None:
+    text = generate(15)
+    answer = day15.part2(BytesSource(text.encode()))
+    x, y = divmod(answer, day15.MAGIC_COEFF)
+
+    for line in text.splitlines():
+        x_s, y_s, x_b, y_b = map(int, re.findall(r"-?\d+", line))
+        assert abs(x - x_s) + abs(y - y_s) > abs(x_b - x_s) + abs(y_b - y_s)
+
+
+def test_day21_human_value() -> None:
+    text = generate(21)
+    match = re.search(r"^humn: (-?\d+)$", text, re.M)
+    assert match is not None
+    human = int(match.group(1))
+    assert day21.part2(BytesSource(text.encode())) == human
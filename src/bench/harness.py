@@ -0,0 +1,116 @@
+import argparse
+import importlib
+import json
+import multiprocessing
+import resource
+import time
+from multiprocessing.connection import Connection
+from typing import Any, Iterable, Iterator, Optional
+
+from bench.generators import GENERATORS, SCALES, generate
+from inputs import BytesSource
+
+
+def _parts(day: int) -> list[int]:
+    module = importlib.import_module(f"day{day}")
+    return [part for part in (1, 2) if hasattr(module, f"part{part}")]
+
+
+def _peak_rss_kb() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _measure(conn: Connection, day: int, part: int, scale: int, seed: int) -> None:
+    data = generate(day, scale, seed).encode()
+    solve = getattr(importlib.import_module(f"day{day}"), f"part{part}")
+
+    # everything allocated so far (interpreter, modules, the input itself) is
+    # the baseline; the record holds how far the solver pushes the peak
+    baseline = _peak_rss_kb()
+    start = time.perf_counter()
+
+    try:
+        answer = solve(BytesSource(data))
+    except Exception as error:  # pylint: disable=broad-except
+        conn.send({"status": "error", "error": f"{type(error).__name__}: {error}"})
+        return
+
+    conn.send(
+        {
+            "status": "ok",
+            "answer": str(answer),
+            "seconds": time.perf_counter() - start,
+            "peak_kb": _peak_rss_kb() - baseline,
+            "input_bytes": len(data),
+        }
+    )
+
+
+def measure(
+    day: int, part: int, scale: int, seed: int = 0, timeout: Optional[float] = None
+) -> dict[str, Any]:
+    # a fresh process per measurement keeps peak memory figures independent and
+    # lets runaway cases be killed
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=_measure, args=(sender, day, part, scale, seed)
+    )
+    process.start()
+    sender.close()
+
+    record: dict[str, Any] = {"day": day, "part": part, "scale": scale, "seed": seed}
+
+    try:
+        if receiver.poll(timeout):
+            record.update(receiver.recv())
+        else:
+            record["status"] = "timeout"
+    except EOFError:
+        record["status"] = "crashed"
+    finally:
+        process.kill()
+        process.join()
+        receiver.close()
+
+    return record
+
+
+def run_benchmarks(
+    days: Iterable[int],
+    scales: Iterable[int] = SCALES,
+    seed: int = 0,
+    timeout: Optional[float] = None,
+) -> Iterator[dict[str, Any]]:
+    for day in days:
+        for part in _parts(day):
+            for scale in scales:
+                record = measure(day, part, scale, seed, timeout)
+                yield record
+
+                # larger inputs would only time out as well
+                if record["status"] == "timeout":
+                    break
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark on scaled inputs.")
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default: all)")
+    parser.add_argument("-s", "--scales", nargs="+", type=int, default=list(SCALES))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-t", "--timeout", type=float, default=60.0)
+    parser.add_argument("-o", "--output", default="bench.json")
+    args = parser.parse_args(argv)
+
+    records = []
+    for record in run_benchmarks(
+        args.days or sorted(GENERATORS), args.scales, args.seed, args.timeout
+    ):
+        print(json.dumps(record), flush=True)
+        records.append(record)
+
+    with open(args.output, "w", encoding="utf-8") as output:
+        json.dump(records, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+from bench import harness
+
+
+def test_measure() -> None:
+    record = harness.measure(1, 1, 1)
+    assert record["status"] == "ok"
+    assert record["input_bytes"] > 0
+    assert record["seconds"] >= 0
+
+
+def test_measure_timeout() -> None:
+    record = harness.measure(24, 1, 1, timeout=0.01)
+    assert record["status"] == "timeout"
@@ -1,17 +1,20 @@
 import itertools
+from typing import Optional
 
+from inputs import InputSource, open_input
 
-def _general_solution(n: int) -> int:
-    with open("data/day1.txt", "r", encoding="utf-8") as data:
+
+def _general_solution(n: int, source: Optional[InputSource]) -> int:
+    with open_input(1, source) as data:
         words = [line.strip() for line in data.readlines()]
         splitted = [list(group) for k, group in itertools.groupby(words, bool) if k]
         sums = [sum(map(int, group)) for group in splitted]
         return sum(sorted(sums, reverse=True)[:n])
 
 
-def part1() -> int:
-    return _general_solution(1)
+def part1(source: Optional[InputSource] = None) -> int:
+    return _general_solution(1, source)
 
 
-def part2() -> int:
-    return _general_solution(3)
+def part2(source: Optional[InputSource] = None) -> int:
+    return _general_solution(3, source)
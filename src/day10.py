@@ -1,3 +1,6 @@
+from inputs import open_input
+
+
 def update_result(result, cycle, x, idxs):
     cycle += 1
     if cycle in idxs:
@@ -5,8 +8,8 @@ def update_result(result, cycle, x, idxs):
     return cycle, result
 
 
-def part1():
-    with open("data/day10.txt", "r", encoding="utf-8") as data:
+def part1(source=None):
+    with open_input(10, source) as data:
         x = 1
         cycle = 1
         idxs = list(i for i in range(20, 221, 40))
@@ -25,8 +28,8 @@ def part1():
         return result
 
 
-def part2():
-    with open("data/day10.txt", "r", encoding="utf-8") as data:
+def part2(source=None):
+    with open_input(10, source) as data:
         x = 1
         x_arr = [1]
         cycle = 1
@@ -1,6 +1,8 @@
 import dataclasses
 from math import prod
-from typing import Callable, List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
+
+from inputs import InputSource, open_input
 
 
 @dataclasses.dataclass
@@ -10,11 +12,33 @@ class ThrowTest:
     f_throw: int
 
 
+@dataclasses.dataclass
+class Operation:
+    op: str
+    number: int
+
+    def __call__(self, worry_level: int) -> int:
+        if self.op == "+":
+            return worry_level + self.number
+        if self.op == "*":
+            return worry_level * self.number
+        return worry_level * worry_level
+
+    def apply_batch(self, worry_levels: List[int]) -> List[int]:
+        # one comprehension per operator instead of a call per item
+        num = self.number
+        if self.op == "+":
+            return [x + num for x in worry_levels]
+        if self.op == "*":
+            return [x * num for x in worry_levels]
+        return [x * x for x in worry_levels]
+
+
 class Monkey:
     def __init__(
         self,
         starting_items: List[int],
-        operation: Callable[[int], int],
+        operation: Operation,
         throw_test: ThrowTest,
     ):
         self.__items = starting_items
@@ -28,9 +52,18 @@ class Monkey:
     def inspected(self) -> int:
         return self.__inspected_items
 
+    def items(self) -> List[int]:
+        return list(self.__items)
+
+    def inspect(self, worry_level: int) -> int:
+        return self.__operation(worry_level)
+
     def append_item(self, item: int) -> None:
         self.__items.append(item)
 
+    def extend_items(self, items: List[int]) -> None:
+        self.__items.extend(items)
+
     def throw_test(self, worry_level: int) -> int:
         if worry_level % self.__throw_test.number == 0:
             return self.__throw_test.t_throw
@@ -50,6 +83,24 @@ class Monkey:
 
         return result
 
+    def do_batch_turn(
+        self, relief: int = 1, modulus: Optional[int] = None
+    ) -> List[Tuple[int, List[int]]]:
+        worry_levels = self.__operation.apply_batch(self.__items)
+        if relief != 1:
+            worry_levels = [x // relief for x in worry_levels]
+        if modulus is not None:
+            worry_levels = [x % modulus for x in worry_levels]
+
+        self.__inspected_items += len(worry_levels)
+        self.__items = []
+
+        number = self.__throw_test.number
+        return [
+            (self.__throw_test.t_throw, [x for x in worry_levels if x % number == 0]),
+            (self.__throw_test.f_throw, [x for x in worry_levels if x % number]),
+        ]
+
 
 def read_starting_items(line: str) -> List[int]:
     parts = line.split(":")
@@ -57,19 +108,14 @@ def read_starting_items(line: str) -> List[int]:
     return [int(num.strip()) for num in numbers]
 
 
-def read_operation(line: str) -> Callable[[int], int]:
+def read_operation(line: str) -> Operation:
     parts = line.split()
     op = parts[-2]
 
     if parts[-1].isdigit():
-        num = int(parts[-1])
-
-        if op == "+":
-            return lambda x: x + num
-
-        return lambda x: x * num
+        return Operation(op, int(parts[-1]))
 
-    return lambda x: x**2
+    return Operation("**", 2)
 
 
 def read_throw_test(lines: List[str]) -> ThrowTest:
@@ -113,19 +159,106 @@ def monkey_business(monkeys: List[Monkey]) -> int:
     return max_inspected * second_max_inspected
 
 
+def item_round(
+    monkeys: List[Monkey],
+    monkey: int,
+    worry_level: int,
+    second_op: Callable[[int], int],
+) -> Tuple[int, int, List[int]]:
+    # an item thrown forward is inspected again later in the same round,
+    # an item thrown backward waits for the next one
+    inspections = [0] * len(monkeys)
+
+    while True:
+        inspections[monkey] += 1
+        worry_level = second_op(monkeys[monkey].inspect(worry_level))
+        new_monkey = monkeys[monkey].throw_test(worry_level)
+
+        if new_monkey < monkey:
+            return new_monkey, worry_level, inspections
+
+        monkey = new_monkey
+
+
+def extrapolate_cycle(
+    inspected: List[int], cycle: List[List[int]], rounds_left: int
+) -> None:
+    full_cycles, remainder = divmod(rounds_left, len(cycle))
+
+    for i, inspections in enumerate(cycle):
+        times = full_cycles + (1 if i < remainder else 0)
+        for m, count in enumerate(inspections):
+            inspected[m] += times * count
+
+
+def track_item(
+    monkeys: List[Monkey],
+    monkey: int,
+    worry_level: int,
+    rounds: int,
+    second_op: Callable[[int], int],
+) -> List[int]:
+    # items never interact, so every item follows its own (monkey, worry)
+    # sequence; once a state repeats the rest of the rounds are extrapolated
+    inspected = [0] * len(monkeys)
+    seen: Dict[Tuple[int, int], int] = {}
+    history: List[List[int]] = []
+
+    for round_idx in range(rounds):
+        state = (monkey, worry_level)
+
+        if state in seen:
+            extrapolate_cycle(inspected, history[seen[state] :], rounds - round_idx)
+            break
+
+        seen[state] = round_idx
+        monkey, worry_level, inspections = item_round(
+            monkeys, monkey, worry_level, second_op
+        )
+        history.append(inspections)
+
+        for m, count in enumerate(inspections):
+            inspected[m] += count
+
+    return inspected
+
+
+def simulate_items(
+    monkeys: List[Monkey], rounds: int, second_op: Callable[[int], int]
+) -> List[int]:
+    inspected = [0] * len(monkeys)
+
+    for idx, monkey in enumerate(monkeys):
+        for item in monkey.items():
+            for m, count in enumerate(
+                track_item(monkeys, idx, item, rounds, second_op)
+            ):
+                inspected[m] += count
+
+    return inspected
+
+
+def top_two_product(inspected: List[int]) -> int:
+    return prod(sorted(inspected)[-2:])
+
+
+def simulate_batched(
+    monkeys: List[Monkey], rounds: int, relief: int = 1, modulus: Optional[int] = None
+) -> None:
+    for _ in range(rounds):
+        for monkey in monkeys:
+            for new_monkey, worry_levels in monkey.do_batch_turn(relief, modulus):
+                monkeys[new_monkey].extend_items(worry_levels)
+
+
 ROUNDS1 = 20
 
 
-def part1() -> int:
-    with open("data/day11.txt", "r", encoding="utf-8") as data:
+def part1(source: Optional[InputSource] = None) -> int:
+    with open_input(11, source) as data:
         lines = data.readlines()
         monkeys = read_monkeys(lines)
-
-        for _ in range(ROUNDS1):
-            for monkey in monkeys:
-                result = monkey.do_turn(lambda x: x // 3)
-                for new_monkey, worry_level in result:
-                    monkeys[new_monkey].append_item(worry_level)
+        simulate_batched(monkeys, ROUNDS1, relief=3)
 
         return monkey_business(monkeys)
 
@@ -133,16 +266,11 @@ def part1() -> int:
 ROUNDS2 = 10_000
 
 
-def part2() -> int:
-    with open("data/day11.txt", "r", encoding="utf-8") as data:
+def part2(source: Optional[InputSource] = None) -> int:
+    with open_input(11, source) as data:
         lines = data.readlines()
         monkeys = read_monkeys(lines)
         common_multiple = prod(monkey.test_number() for monkey in monkeys)
+        inspected = simulate_items(monkeys, ROUNDS2, lambda x: x % common_multiple)
 
-        for _ in range(ROUNDS2):
-            for monkey in monkeys:
-                result = monkey.do_turn(lambda x: x % common_multiple)
-                for new_monkey, worry_level in result:
-                    monkeys[new_monkey].append_item(worry_level)
-
-        return monkey_business(monkeys)
+        return top_two_product(inspected)
@@ -1,4 +1,7 @@
+from math import prod
+
 import day11
+from inputs import open_input
 
 
 def test_part1() -> None:
@@ -7,3 +10,32 @@ def test_part1() -> None:
 
 def test_part2() -> None:
     assert day11.part2() == 14636993466
+
+
+def test_simulate_items() -> None:
+    with open_input(11) as data:
+        monkeys = day11.read_monkeys(data.readlines())
+
+    inspected = day11.simulate_items(monkeys, day11.ROUNDS1, lambda x: x // 3)
+    assert day11.top_two_product(inspected) == day11.part1()
+
+
+def test_simulate_batched() -> None:
+    with open_input(11) as data:
+        monkeys = day11.read_monkeys(data.readlines())
+
+    modulus = prod(monkey.test_number() for monkey in monkeys)
+    day11.simulate_batched(monkeys, day11.ROUNDS2, modulus=modulus)
+    assert day11.monkey_business(monkeys) == day11.part2()
+
+
+def test_do_turn() -> None:
+    with open_input(11) as data:
+        monkeys = day11.read_monkeys(data.readlines())
+
+    for _ in range(day11.ROUNDS1):
+        for monkey in monkeys:
+            for new_monkey, worry_level in monkey.do_turn(lambda x: x // 3):
+                monkeys[new_monkey].append_item(worry_level)
+
+    assert day11.monkey_business(monkeys) == day11.part1()
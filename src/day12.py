@@ -1,113 +1,79 @@
-import heapq
-from typing import Callable, Generator, List, Set, Tuple
+from array import array
+from typing import List, Optional, Tuple
 
+from inputs import InputSource, open_input
 
-def read_heights(
-    lines: List[str],
-) -> Tuple[List[List[int]], Tuple[int, int], Tuple[int, int]]:
-    board = []
-    start = (0, 0)
-    end = (0, 0)
-
-    for r_idx, line in enumerate(lines):
-        row = []
-        for c_idx, elem in enumerate(line.strip()):
-            if elem == "S":
-                start = (r_idx, c_idx)
-                row.append(0)
-            elif elem == "E":
-                end = (r_idx, c_idx)
-                row.append(ord("z") - ord("a"))
-            else:
-                row.append(ord(elem) - ord("a"))
-        board.append(row)
-
-    return board, start, end
+# border cells are far too high to climb onto and are never queued
+BORDER = 127
+UNREACHED = -1
 
 
-def board_size(board: List[List[int]]) -> Tuple[int, int]:
-    return len(board), len(board[0])
-
-
-def initialize_distances(n: int, m: int, start: Tuple[int, int]) -> List[List[int]]:
-    infinity = n * m + 1
-    distances = [[infinity for _ in range(m)] for _ in range(n)]
-    distances[start[0]][start[1]] = 0
-
-    return distances
+def read_heights(lines: List[str]) -> Tuple[array, int, int, int]:
+    rows = [line.strip() for line in lines if line.strip()]
+    width = len(rows[0]) + 2
+    heights = array("b", [BORDER]) * (width * (len(rows) + 2))
+    start, end = 0, 0
 
+    for r_idx, row in enumerate(rows):
+        for c_idx, elem in enumerate(row):
+            pos = (r_idx + 1) * width + c_idx + 1
 
-def neighbors(
-    heights: List[List[int]], pos: Tuple[int, int], cond: Callable[[int, int], bool]
-) -> Generator[Tuple[int, int], None, None]:
-    row, col = pos
-    num_rows, num_cols = len(heights), len(heights[0])
-
-    for r, c in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-        new_row, new_col = row + r, col + c
+            if elem == "S":
+                start = pos
+                elem = "a"
+            elif elem == "E":
+                end = pos
+                elem = "z"
 
-        if new_row < 0 or new_row >= num_rows or new_col < 0 or new_col >= num_cols:
-            continue
+            heights[pos] = ord(elem) - ord("a")
 
-        new_height = heights[new_row][new_col]
-        height = heights[row][col]
+    return heights, width, start, end
 
-        if cond(new_height, height):
-            yield new_row, new_col
 
+def calculate_distances(heights: array, width: int, starts: List[int]) -> array:
+    # plain BFS, every start is at distance 0; the result is the whole field
+    distances = array("i", [UNREACHED]) * len(heights)
+    offsets = (-width, width, -1, 1)
+    frontier = list(starts)
 
-def calculate_distances(
-    start: Tuple[int, int], heights: List[List[int]], cond: Callable[[int, int], bool]
-) -> List[List[int]]:
-    r_num, c_num = board_size(heights)
-    distances = initialize_distances(r_num, c_num, start)
-    pq: List[Tuple[int, Tuple[int, int]]] = [(0, start)]
-    heapq.heapify(pq)
-    visited: Set[Tuple[int, int]] = set()
+    for pos in frontier:
+        distances[pos] = 0
 
-    while pq:
-        dist, pos = heapq.heappop(pq)
+    distance = 0
+    while frontier:
+        distance += 1
+        next_frontier = []
 
-        if pos in visited:
-            continue
+        for pos in frontier:
+            max_height = heights[pos] + 1
 
-        visited.add(pos)
+            for offset in offsets:
+                neighbor = pos + offset
 
-        for neigh_r, neigh_c in neighbors(heights, pos, cond):
-            distance = dist + 1
+                if (
+                    distances[neighbor] == UNREACHED
+                    and heights[neighbor] <= max_height
+                ):
+                    distances[neighbor] = distance
+                    next_frontier.append(neighbor)
 
-            if distance < distances[neigh_r][neigh_c]:
-                distances[neigh_r][neigh_c] = distance
-                heapq.heappush(pq, (distance, (neigh_r, neigh_c)))
+        frontier = next_frontier
 
     return distances
 
 
-def part1() -> int:
-    with open("data/day12.txt", "r", encoding="utf-8") as data:
-        heights, start, end = read_heights(data.readlines())
-        distances = calculate_distances(start, heights, lambda x, y: x - y <= 1)
-
-        return distances[end[0]][end[1]]
-
-
-def find_minimum(
-    r_num: int, c_num: int, heights: List[List[int]], distances: List[List[int]]
-) -> int:
-    minimum = r_num * c_num
-
-    for r in range(r_num):
-        for c in range(c_num):
-            if heights[r][c] == 0:
-                minimum = min(minimum, distances[r][c])
+def part1(source: Optional[InputSource] = None) -> int:
+    with open_input(12, source) as data:
+        heights, width, start, end = read_heights(data.readlines())
+        distances = calculate_distances(heights, width, [start])
 
-    return minimum
+        return distances[end]
 
 
-def part2() -> int:
-    with open("data/day12.txt", "r", encoding="utf-8") as data:
-        heights, _, end = read_heights(data.readlines())
-        r_num, c_num = board_size(heights)
-        distances = calculate_distances(end, heights, lambda x, y: y - x <= 1)
+def part2(source: Optional[InputSource] = None) -> int:
+    with open_input(12, source) as data:
+        heights, width, _, end = read_heights(data.readlines())
+        starts = [pos for pos, height in enumerate(heights) if height == 0]
+        distances = calculate_distances(heights, width, starts)
 
-        return find_minimum(r_num, c_num, heights, distances)
+        return distances[end]
@@ -7,3 +7,12 @@ def test_part1() -> None:
 
 def test_part2() -> None:
     assert day12.part2() == 508
+
+
+def test_distance_field() -> None:
+    lines = ["Sabqponm\n", "abcryxxl\n", "accszExk\n", "acctuvwj\n", "abdefghi\n"]
+    heights, width, start, end = day12.read_heights(lines)
+    distances = day12.calculate_distances(heights, width, [start])
+    assert distances[end] == 31
+    assert distances[start + 1] == 1
+    assert distances[0] == day12.UNREACHED
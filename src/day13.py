@@ -1,14 +1,8 @@
-from dataclasses import dataclass
+from bisect import bisect_left
 
+from inputs import open_input
 
-@dataclass
-class Node:
-    value: int
-    children: list
-
-
-def pack_node(node):
-    return Node(None, [node])
+DIVIDERS = (((2,),), ((6,),))
 
 
 def signum(x):
@@ -19,127 +13,96 @@ def signum(x):
     return 0
 
 
-def compare_integers(x, y):
-    return signum(x - y)
-
-
-def compare_arr_nodes(node1, node2):
-    if len(node1.children) == 0:
-        if len(node2.children) == 0:
-            return 0
-        return -1
-    if len(node2.children) == 0:
-        return 1
-
-    inner1 = node1.children[0]
-    inner2 = node2.children[0]
-    first_compare = compare_nodes(inner1, inner2)
-
-    if first_compare != 0:
-        return first_compare
-
-    new_arr1 = Node(None, node1.children[1:])
-    new_arr2 = Node(None, node2.children[1:])
-
-    return compare_nodes(new_arr1, new_arr2)
+def read_packet(text):
+    # single pass over the characters, lists are built on an explicit stack
+    stack = []
+    current = []
+    number = None
 
+    for c in text.strip():
+        if c == "[":
+            stack.append(current)
+            current = []
+        elif c in ",]":
+            if number is not None:
+                current.append(number)
+                number = None
+            if c == "]":
+                packet = tuple(current)
+                current = stack.pop()
+                current.append(packet)
+        else:
+            number = (number or 0) * 10 + ord(c) - ord("0")
 
-def compare_nodes(node1, node2):
-    is_array1 = node1.value is None
-    is_array2 = node2.value is None
-
-    if is_array1 and is_array2:
-        return compare_arr_nodes(node1, node2)
+    return current[0]
 
-    if not is_array1 and is_array2:
-        return compare_arr_nodes(pack_node(node1), node2)
 
-    if is_array1 and not is_array2:
-        return compare_arr_nodes(node1, pack_node(node2))
+def compare_packets(left, right):
+    left_is_int = isinstance(left, int)
+    right_is_int = isinstance(right, int)
 
-    return compare_integers(node1.value, node2.value)
+    if left_is_int and right_is_int:
+        return signum(left - right)
+    if left_is_int:
+        left = (left,)
+    if right_is_int:
+        right = (right,)
 
+    for left_child, right_child in zip(left, right):
+        if result := compare_packets(left_child, right_child):
+            return result
 
-def read_commas(text):
-    commas = []
-    depth = 0
+    return signum(len(left) - len(right))
 
-    for i, c in enumerate(text):
-        if c == "[":
-            depth += 1
-        elif c == "]":
-            depth -= 1
 
-        if depth == 1 and c == ",":
-            commas.append(i)
+def packet_depth(packet):
+    if isinstance(packet, int):
+        return 0
+    return 1 + max((packet_depth(child) for child in packet), default=0)
 
-    return commas
 
+def packet_key(packet, depth):
+    # An integer compares exactly like the list holding only that integer, so
+    # wrapping every integer down to the same depth changes no comparison.
+    # When that depth is below every list, integers only meet integers and
+    # lists only meet lists, which is plain tuple ordering.
+    if isinstance(packet, int):
+        for _ in range(depth):
+            packet = (packet,)
+        return packet
 
-def read_node(text):
-    # array case
-    if text[0] == "[":
-        if text[1] == "]":
-            return Node(None, [])
+    return tuple(packet_key(child, depth - 1) for child in packet)
 
-        children = []
-        commas = read_commas(text)
-        starts = [0] + commas
-        ends = commas + [len(text) - 1]
 
-        for start, end in zip(starts, ends):
-            children.append(read_node(text[start + 1 : end]))
+def sort_packets(packets):
+    depth = max(map(packet_depth, packets), default=0)
+    return sorted(packets, key=lambda packet: packet_key(packet, depth))
 
-        return Node(None, children)
 
-    # value case
-    value = int(text)
-    return Node(value, None)
+def read_packets(lines):
+    return [read_packet(line) for line in lines if line.strip()]
 
 
-def part1():
-    with open("data/day13.txt", "r", encoding="utf-8") as data:
-        lines = data.readlines()
-        num_of_instances = (len(lines) + 1) // 3
+def part1(source=None):
+    with open_input(13, source) as data:
+        packets = read_packets(data.readlines())
         result = 0
 
-        for i in range(num_of_instances):
-            node1 = read_node(lines[i * 3].strip())
-            node2 = read_node(lines[i * 3 + 1].strip())
-
-            if compare_nodes(node1, node2) == -1:
-                result += i + 1
+        for i in range(0, len(packets), 2):
+            if compare_packets(packets[i], packets[i + 1]) == -1:
+                result += i // 2 + 1
 
         return result
 
 
-def double_packed(value):
-    node = Node(value, None)
-    return pack_node(pack_node(node))
-
-
-def part2():
-    with open("data/day13.txt", "r", encoding="utf-8") as data:
-        lines = data.readlines()
-        num_of_instances = (len(lines) + 1) // 3
-        nodes = []
-
-        for i in range(num_of_instances):
-            node1 = read_node(lines[i * 3].strip())
-            node2 = read_node(lines[i * 3 + 1].strip())
-            nodes.append(node1)
-            nodes.append(node2)
-
-        double_two = double_packed(2)
-        double_six = double_packed(6)
-
-        count_two = 1
-        count_six = 2
+def part2(source=None):
+    with open_input(13, source) as data:
+        packets = read_packets(data.readlines())
+        depth = max(map(packet_depth, packets + list(DIVIDERS)))
+        keys = sorted(packet_key(packet, depth) for packet in packets)
+        two, six = (packet_key(divider, depth) for divider in DIVIDERS)
 
-        for node in nodes:
-            if compare_nodes(node, double_two) == -1:
-                count_two += 1
-            if compare_nodes(node, double_six) == -1:
-                count_six += 1
+        count_two = 1 + bisect_left(keys, two)
+        count_six = 2 + bisect_left(keys, six)
 
         return count_two * count_six
@@ -1,4 +1,5 @@
 import day13
+from inputs import open_input
 
 
 def test_part1() -> None:
@@ -7,3 +8,28 @@ def test_part1() -> None:
 
 def test_part2() -> None:
     assert day13.part2() == 23600
+
+
+def test_read_packet() -> None:
+    assert day13.read_packet("[1,[2,[]],10]\n") == (1, (2, ()), 10)
+    assert day13.read_packet("[]") == ()
+
+
+def test_packet_key() -> None:
+    with open_input(13) as data:
+        packets = day13.read_packets(data.readlines())
+
+    packets += [((1, 2),), (1, 3), ((1,), 2), (1, (2,))]
+    depth = max(map(day13.packet_depth, packets))
+
+    for left in packets[::7]:
+        for right in packets[::5]:
+            key_left = day13.packet_key(left, depth)
+            key_right = day13.packet_key(right, depth)
+            by_key = (key_left > key_right) - (key_left < key_right)
+            assert by_key == day13.compare_packets(left, right)
+
+
+def test_sort_packets() -> None:
+    packets = [(1, 3), ((1, 2),), ((1,), 2), ()]
+    assert day13.sort_packets(packets) == [(), ((1,), 2), (1, 3), ((1, 2),)]
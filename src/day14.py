@@ -1,3 +1,6 @@
+from inputs import open_input
+
+
 def read_pair(text):
     t = text.strip().split(",")
     x = int(t[0])
@@ -52,25 +55,107 @@ def generate_path(positions, idx):
             yield (x, y)
 
 
-def part1():
-    with open("data/day14.txt", "r", encoding="utf-8") as data:
-        lines = data.readlines()
+def read_rocks(lines):
+    rocks = set()
+    max_y = 0
+
+    for line in lines:
+        pairs = line.split(" -> ")
+        positions = [read_pair(pair) for pair in pairs]
+        local_max = max(y for _, y in positions)
+        max_y = max(max_y, local_max)
+        n = len(positions)
+
+        for i in range(n - 1):
+            for x, y in generate_path(positions, i):
+                rocks.add((x, y))
+
+    return rocks, max_y
+
+
+SOURCE_X = 500
+FREE, ROCK, SAND = 0, 1, 2
+
+
+def build_cave(rocks, max_y, floor):
+    # Dense cave, one byte per cell. Without a floor, sand never gets further
+    # than one column past the rocks; with one, it cannot spread wider than
+    # the floor depth on either side of the source.
+    height = max_y + 3
+    if floor:
+        left, right = SOURCE_X - height - 1, SOURCE_X + height + 1
+    else:
+        left = min(x for x, _ in rocks) - 2
+        right = max(x for x, _ in rocks) + 2
+
+    width = right - left + 1
+    cave = bytearray(width * height)
+
+    for x, y in rocks:
+        cave[y * width + x - left] = ROCK
+
+    if floor:
+        cave[(height - 1) * width :] = bytes([ROCK]) * width
+
+    return cave, width, SOURCE_X - left
+
+
+def pour_sand(rocks, max_y, floor=False):
+    # The next grain follows the previous one until the cell where that grain
+    # came to rest, so it resumes from the last free cell of the stored path
+    # and every cell is entered O(1) times in total.
+    cave, width, source = build_cave(rocks, max_y, floor)
+    abyss = (max_y + 1) * width
+    path = [source]
+    count = 0
 
-        rocks = set()
-        max_y = 0
+    while path:
+        pos = path[-1]
 
-        for line in lines:
-            pairs = line.split(" -> ")
-            positions = [read_pair(pair) for pair in pairs]
-            local_max = max(y for _, y in positions)
-            max_y = max(max_y, local_max)
-            n = len(positions)
+        if not floor and pos >= abyss:
+            break
+
+        below = pos + width
+        for nxt in (below, below - 1, below + 1):
+            if cave[nxt] == FREE:
+                path.append(nxt)
+                break
+        else:
+            cave[pos] = SAND
+            path.pop()
+            count += 1
+
+    return count
 
-            for i in range(n - 1):
-                for x, y in generate_path(positions, i):
-                    rocks.add((x, y))
 
-        return simulate_sand(max_y, rocks, simulate_step1)
+def count_floor_fill(rocks, max_y):
+    # With a floor the sand ends up in exactly the free cells reachable from
+    # the source by falling straight or diagonally, so it can be swept row by
+    # row with one big integer per row (bit i is column offset + i).
+    floor = max_y + 2
+    offset = SOURCE_X - floor
+    rock_rows = [0] * floor
+
+    for x, y in rocks:
+        if 0 <= x - offset <= 2 * floor and y < floor:
+            rock_rows[y] |= 1 << (x - offset)
+
+    reachable = 1 << (SOURCE_X - offset)
+    count = 0
+
+    for rock_row in rock_rows:
+        reachable &= ~rock_row
+        count += reachable.bit_count()
+        reachable |= (reachable << 1) | (reachable >> 1)
+
+    return count
+
+
+def part1(source=None):
+    with open_input(14, source) as data:
+        rocks, max_y = read_rocks(data.readlines())
+
+        return pour_sand(rocks, max_y)
 
 
 def simulate_step2(max_y, rocks):
@@ -98,22 +183,8 @@ def simulate_step2(max_y, rocks):
     return moved, xs, ys
 
 
-def part2():
-    with open("data/day14.txt", "r", encoding="utf-8") as data:
-        lines = data.readlines()
-
-        rocks = set()
-        max_y = 0
-
-        for line in lines:
-            pairs = line.split(" -> ")
-            positions = [read_pair(pair) for pair in pairs]
-            local_max = max(y for _, y in positions)
-            max_y = max(max_y, local_max)
-            n = len(positions)
-
-            for i in range(n - 1):
-                for x, y in generate_path(positions, i):
-                    rocks.add((x, y))
+def part2(source=None):
+    with open_input(14, source) as data:
+        rocks, max_y = read_rocks(data.readlines())
 
-        return 1 + simulate_sand(max_y, rocks, simulate_step2)
+        return count_floor_fill(rocks, max_y)
@@ -1,4 +1,5 @@
 import day14
+from inputs import open_input
 
 
 def test_part1() -> None:
@@ -7,3 +8,24 @@ def test_part1() -> None:
 
 def test_part2() -> None:
     assert day14.part2() == 23390
+
+
+def test_pour_sand() -> None:
+    with open_input(14) as data:
+        rocks, max_y = day14.read_rocks(data.readlines())
+
+    assert day14.pour_sand(rocks, max_y) == day14.simulate_sand(
+        max_y, set(rocks), day14.simulate_step1
+    )
+    assert day14.pour_sand(rocks, max_y, floor=True) == 1 + day14.simulate_sand(
+        max_y, set(rocks), day14.simulate_step2
+    )
+
+
+def test_count_floor_fill() -> None:
+    with open_input(14) as data:
+        rocks, max_y = day14.read_rocks(data.readlines())
+
+    assert day14.count_floor_fill(rocks, max_y) == 1 + day14.simulate_sand(
+        max_y, set(rocks), day14.simulate_step2
+    )
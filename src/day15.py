@@ -1,3 +1,11 @@
+import functools
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from inputs import open_input
+
+
 def interpret_sensor_data(line):
     words = line.split()
 
@@ -16,69 +24,157 @@ def manhattan_dist(x1, y1, x2, y2):
     return abs(x1 - x2) + abs(y1 - y2)
 
 
-class Intervals:
-    def __init__(self):
-        self.intervals = []
+def read_sensors(lines):
+    sensors = []
+    beacons = set()
+
+    for line in lines:
+        x_s, y_s, x_b, y_b = interpret_sensor_data(line.strip())
+        sensors.append((x_s, y_s, manhattan_dist(x_s, y_s, x_b, y_b)))
+        beacons.add((x_b, y_b))
+
+    return sensors, beacons
 
-    def are_overlapping(self, a, b):
-        a_s, a_t = a
-        b_s, b_t = b
-        return a_s <= b_t and b_s <= a_t
 
-    def merge_two_intervals(self, a, b):
-        a_s, a_t = a
-        b_s, b_t = b
-        return min(a_s, b_s), max(a_t, b_t)
+def row_intervals(sensors, y):
+    # project every sensor onto the row, then merge the sorted segments in a
+    # single sweep
+    segments = []
 
-    def add_interval(self, s, t):
-        new_interval = (s, t)
-        new_intervals = []
+    for x_s, y_s, distance in sensors:
+        x_distance = distance - abs(y_s - y)
+        if x_distance >= 0:
+            segments.append((x_s - x_distance, x_s + x_distance))
 
-        for i in self.intervals:
-            if self.are_overlapping(i, new_interval):
-                new_interval = self.merge_two_intervals(i, new_interval)
-            else:
-                new_intervals.append(i)
+    segments.sort()
+    merged = []
 
-        new_intervals.append(new_interval)
-        self.intervals = new_intervals
+    for s, t in segments:
+        if merged and s <= merged[-1][1] + 1:
+            if t > merged[-1][1]:
+                merged[-1] = (merged[-1][0], t)
+        else:
+            merged.append((s, t))
 
-    def get_length(self):
-        return sum(t - s + 1 for s, t in self.intervals)
+    return merged
 
 
-def part1():
-    with open("data/day15.txt", "r", encoding="utf-8") as data:
-        forbidden = Intervals()
-        beacons = set()
+def row_coverage(sensors, beacons, y):
+    covered = sum(t - s + 1 for s, t in row_intervals(sensors, y))
+    return covered - sum(1 for _, y_b in beacons if y_b == y)
 
-        for line in data.readlines():
-            x_s, y_s, x_b, y_b = interpret_sensor_data(line.strip())
-            distance = manhattan_dist(x_s, y_s, x_b, y_b)
-            distance_to_magic_y = manhattan_dist(x_s, y_s, x_s, MAGIC_Y)
-            x_distance = distance - distance_to_magic_y
 
-            if y_b == MAGIC_Y:
-                beacons.add(x_b)
+def batch_coverage(sensors, beacons, rows, workers=None):
+    rows = list(rows)
+    count_row = functools.partial(row_coverage, sensors, beacons)
+    workers = workers or os.cpu_count() or 1
 
-            if x_distance >= 0:
-                forbidden.add_interval(x_s - x_distance, x_s + x_distance)
+    if workers == 1:
+        return dict(zip(rows, map(count_row, rows)))
 
-        return forbidden.get_length() - len(beacons)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunksize = max(1, len(rows) // (4 * workers))
+        return dict(zip(rows, executor.map(count_row, rows, chunksize=chunksize)))
+
+
+def part1(source=None):
+    with open_input(15, source) as data:
+        sensors, beacons = read_sensors(data.readlines())
+
+        return row_coverage(sensors, beacons, MAGIC_Y)
 
 
 MAGIC_COEFF = 4000000
 
 
-def distance_neighbors(x, y, dist):
-    for dx in range(-dist, dist + 1):
-        dy = dist - abs(dx)
-        potential = set([(x + dx, y + dy), (x + dx, y - dy)])
+def signum(value):
+    return (value > 0) - (value < 0)
+
+
+def gap_lines(sensors):
+    # in rotated coordinates u = x + y, v = x - y every sensor covers a square;
+    # a free cell squeezed between two sensors exactly two apart lies on the
+    # line where both squares grown by one coincide
+    u_lines = set()
+    v_lines = set()
+
+    for (x_a, y_a, d_a), (x_b, y_b, d_b) in itertools.combinations(sensors, 2):
+        gap = d_a + d_b + 2
+        if manhattan_dist(x_a, y_a, x_b, y_b) != gap:
+            continue
+
+        du = (x_b + y_b) - (x_a + y_a)
+        dv = (x_b - y_b) - (x_a - y_a)
+
+        if abs(du) == gap:
+            u_lines.add(x_a + y_a + (d_a + 1) * signum(du))
+        if abs(dv) == gap:
+            v_lines.add(x_a - y_a + (d_a + 1) * signum(dv))
+
+    return u_lines, v_lines
+
+
+def boundary_lines(sensors):
+    # every edge of every square grown by one, for gaps not squeezed between
+    # a pair of sensors
+    u_lines = set()
+    v_lines = set()
+
+    for x, y, dist in sensors:
+        u_lines.update((x + y - dist - 1, x + y + dist + 1))
+        v_lines.update((x - y - dist - 1, x - y + dist + 1))
 
-        for a, b in potential:
-            if a < 0 or b < 0 or a > MAGIC_COEFF or b > MAGIC_COEFF:
+    return u_lines, v_lines
+
+
+def row_gap(sensors, y, bound):
+    x = 0
+
+    for s, t in row_intervals(sensors, y):
+        if s > x:
+            break
+        x = max(x, t + 1)
+
+    return x if x <= bound else None
+
+
+def edge_candidates(sensors, bound):
+    # a gap on the border of the search area needs only one sensor on each
+    # side, so the frame rows and columns are swept directly
+    transposed = [(y, x, dist) for x, y, dist in sensors]
+
+    for y in (0, bound):
+        if (x := row_gap(sensors, y, bound)) is not None:
+            yield x, y
+    for x in (0, bound):
+        if (y := row_gap(transposed, x, bound)) is not None:
+            yield x, y
+
+
+def line_candidates(lines, bound):
+    u_lines, v_lines = lines
+
+    for u in u_lines:
+        for v in v_lines:
+            if (u + v) % 2:
                 continue
-            yield a, b
+
+            x, y = (u + v) // 2, (u - v) // 2
+            if 0 <= x <= bound and 0 <= y <= bound:
+                yield x, y
+
+
+def find_beacon(sensors, bound):
+    # cheap candidates first, all boundary intersections as the last resort
+    for pos in itertools.chain(
+        line_candidates(gap_lines(sensors), bound),
+        edge_candidates(sensors, bound),
+        line_candidates(boundary_lines(sensors), bound),
+    ):
+        if not any(conflicting(s, pos) for s in sensors):
+            return pos
+
+    raise ValueError("No solution found")
 
 
 def conflicting(sensor, pos):
@@ -88,21 +184,9 @@ def conflicting(sensor, pos):
     return manhattan_dist(a, b, x, y) <= d
 
 
-def part2():
-    with open("data/day15.txt", "r", encoding="utf-8") as data:
-        sensors = []
-
-        for line in data.readlines():
-            x_s, y_s, x_b, y_b = interpret_sensor_data(line.strip())
-            distance = manhattan_dist(x_s, y_s, x_b, y_b)
-            sensors.append((x_s, y_s, distance))
-
-        sensors.sort(key=lambda x: x[2])
-
-        for x, y, dist in sensors:
-            for neighbor in distance_neighbors(x, y, dist + 1):
-                if any(conflicting(s, neighbor) for s in sensors):
-                    continue
-                return MAGIC_COEFF * neighbor[0] + neighbor[1]
+def part2(source=None):
+    with open_input(15, source) as data:
+        sensors, _ = read_sensors(data.readlines())
 
-        raise ValueError("No solution found")
+        x, y = find_beacon(sensors, MAGIC_COEFF)
+        return MAGIC_COEFF * x + y
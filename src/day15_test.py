@@ -1,4 +1,5 @@
 import day15
+from inputs import open_input
 
 
 def test_part1() -> None:
@@ -7,3 +8,58 @@ def test_part1() -> None:
 
 def test_part2() -> None:
     assert day15.part2() == 13360899249595
+
+
+def test_batch_coverage() -> None:
+    with open_input(15) as data:
+        sensors, beacons = day15.read_sensors(data.readlines())
+
+    rows = range(day15.MAGIC_Y - 50, day15.MAGIC_Y + 50)
+    serial = day15.batch_coverage(sensors, beacons, rows, workers=1)
+    assert day15.batch_coverage(sensors, beacons, rows, workers=2) == serial
+    assert serial[day15.MAGIC_Y] == day15.part1()
+
+
+def test_find_beacon() -> None:
+    # the example from the puzzle statement, searched in a 20 x 20 square
+    lines = [
+        "Sensor at x=2, y=18: closest beacon is at x=-2, y=15",
+        "Sensor at x=9, y=16: closest beacon is at x=10, y=16",
+        "Sensor at x=13, y=2: closest beacon is at x=15, y=3",
+        "Sensor at x=12, y=14: closest beacon is at x=10, y=16",
+        "Sensor at x=10, y=20: closest beacon is at x=10, y=16",
+        "Sensor at x=14, y=17: closest beacon is at x=10, y=16",
+        "Sensor at x=8, y=7: closest beacon is at x=2, y=10",
+        "Sensor at x=2, y=0: closest beacon is at x=2, y=10",
+        "Sensor at x=0, y=11: closest beacon is at x=2, y=10",
+        "Sensor at x=20, y=14: closest beacon is at x=25, y=17",
+        "Sensor at x=17, y=20: closest beacon is at x=21, y=22",
+        "Sensor at x=16, y=7: closest beacon is at x=15, y=3",
+        "Sensor at x=14, y=3: closest beacon is at x=15, y=3",
+        "Sensor at x=20, y=1: closest beacon is at x=15, y=3",
+    ]
+    sensors, _ = day15.read_sensors(lines)
+    assert day15.find_beacon(sensors, 20) == (14, 11)
+
+    # a gap in the corner is not squeezed between two sensors
+    sensors = [(3, 3, 5), (6, 6, 1), (0, 6, 1), (6, 0, 1)]
+    assert day15.find_beacon(sensors, 6) == (0, 0)
+
+    # an interior gap without a sensor pair exactly two apart on each diagonal
+    lines = [
+        f"Sensor at x={x}, y={y}: closest beacon is at x={x + dist}, y={y}"
+        for x, y, dist in [
+            (13, 12, 4),
+            (7, 12, 4),
+            (12, 7, 4),
+            (5, 9, 4),
+            (0, 0, 18),
+            (0, 19, 17),
+            (15, 4, 9),
+            (15, 15, 8),
+            (19, 10, 7),
+            (19, 20, 17),
+        ]
+    ]
+    sensors, _ = day15.read_sensors(lines)
+    assert day15.find_beacon(sensors, 20) == (10, 10)
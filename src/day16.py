@@ -1,89 +1,156 @@
-from functools import cache
+import math
+import threading
+from collections import OrderedDict
 
-flow_rate: dict[str, int] = {}
-neighbors: dict[str, list[str]] = {}
+from inputs import open_input
 
+START = "AA"
+DEFAULT_MEMO_SIZE = 1 << 20
+_MISSING = object()
+
+
+def parse_valves(lines):
+    rates = {}
+    tunnels = {}
 
-def read_input(lines):
     for line in lines:
         words = line.split()
-        valve = words[1]
-        flow_rate[valve] = int((words[4]).strip("rate=;"))
-        neighbors[valve] = [w.strip(",") for w in words[9:]]
+        rates[words[1]] = int((words[4]).strip("rate=;"))
+        tunnels[words[1]] = [w.strip(",") for w in words[9:]]
 
+    return rates, tunnels
 
-def add_to_opened(pos, opened):
-    opened_arr = opened.split(",")
-    opened_arr.append(pos)
-    return ",".join(sorted(opened_arr))
 
+def all_distances(tunnels):
+    # Floyd-Warshall over the whole tunnel graph
+    names = list(tunnels)
+    dist = {a: {b: 0 if a == b else math.inf for b in names} for a in names}
 
-@cache
-def score(pos, time, opened):
-    if time == 0:
-        return 0
+    for a, targets in tunnels.items():
+        for b in targets:
+            dist[a][b] = 1
 
-    result = 0
+    for k in names:
+        dist_k = dist[k]
+        for a in names:
+            dist_a = dist[a]
+            a_k = dist_a[k]
+            for b in names:
+                if a_k + dist_k[b] < dist_a[b]:
+                    dist_a[b] = a_k + dist_k[b]
 
-    if flow_rate[pos] > 0 and pos not in opened:
-        added_score = flow_rate[pos] * (time - 1)
-        visited_score = score(pos, time - 1, add_to_opened(pos, opened))
-        result = max(result, added_score + visited_score)
-        return result
+    return dist
 
-    moving_score = max(score(n, time - 1, opened) for n in neighbors[pos])
 
-    return max(result, moving_score)
+def compress(rates, tunnels, start=START):
+    # only valves worth opening that can be reached remain, the start is
+    # appended as the last node; valve i is bit i of an opened mask
+    dist = all_distances(tunnels)
+    valves = [v for v in tunnels if rates[v] > 0 and dist[start][v] < math.inf]
+    nodes = valves + [start]
 
+    return [rates[v] for v in valves], [[dist[a][b] for b in valves] for a in nodes]
 
-@cache
-def score2(humn, eleph, time, opened, elephant):
-    if time == 0:
-        return 0
 
-    result = 0
+def best_pressures(flows, distances, time):
+    # best released pressure for every set of valves a single agent can open
+    best = {}
+    stack = [(len(flows), time, 0, 0)]
 
-    # elephant
-    if elephant:
-        if flow_rate[eleph] > 0 and eleph not in opened:
-            added_score = flow_rate[eleph] * (time - 1)
-            visited_score = score2(
-                humn, eleph, time - 1, add_to_opened(eleph, opened), False
-            )
-            result = max(result, added_score + visited_score)
-            return result
+    while stack:
+        pos, left, opened, pressure = stack.pop()
+        if best.get(opened, -1) < pressure:
+            best[opened] = pressure
 
-        moving_score = max(
-            score2(humn, n, time - 1, opened, False) for n in neighbors[eleph]
-        )
+        for valve, (flow, dist) in enumerate(zip(flows, distances[pos])):
+            remaining = left - dist - 1
+            if remaining <= 0 or opened >> valve & 1:
+                continue
+            stack.append(
+                (valve, remaining, opened | 1 << valve, pressure + flow * remaining)
+            )
 
-        return max(result, moving_score)
+    return best
 
-    # human
-    humn, eleph = max(humn, eleph), min(humn, eleph)
 
-    if flow_rate[humn] > 0 and humn not in opened:
-        added_score = flow_rate[humn] * (time - 1)
-        visited_score = score2(humn, eleph, time, add_to_opened(humn, opened), True)
-        result = max(result, added_score + visited_score)
-        return result
+def best_disjoint_pair(best):
+    ranked = sorted(best.items(), key=lambda item: -item[1])
+    result = 0
 
-    moving_score = max(score2(n, eleph, time, opened, True) for n in neighbors[humn])
+    for i, (mask_a, pressure_a) in enumerate(ranked):
+        if 2 * pressure_a <= result:
+            break
+
+        for mask_b, pressure_b in ranked[i:]:
+            if pressure_a + pressure_b <= result:
+                break
+            if not mask_a & mask_b:
+                result = pressure_a + pressure_b
+
+    return result
+
+
+class ValveNetwork:
+    # owns one parsed graph and one memo for the compressed graph and the
+    # subset tables per time budget, so several networks can live in one
+    # process; memo_size=None leaves the memo unbounded
+    def __init__(self, lines, memo_size=DEFAULT_MEMO_SIZE):
+        self.flow_rate, self.neighbors = parse_valves(lines)
+        self.memo_size = memo_size
+        self._memo: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def memo_len(self):
+        return len(self._memo)
+
+    def clear_memo(self):
+        with self._lock:
+            self._memo.clear()
+
+    def _recall(self, key):
+        with self._lock:
+            value = self._memo.get(key, _MISSING)
+            if value is not _MISSING:
+                self._memo.move_to_end(key)
+            return value
+
+    def _remember(self, key, value):
+        with self._lock:
+            self._memo[key] = value
+            self._memo.move_to_end(key)
+            if self.memo_size is not None:
+                while len(self._memo) > self.memo_size:
+                    self._memo.popitem(last=False)
+        return value
+
+    def _cached(self, key, compute):
+        if (value := self._recall(key)) is _MISSING:
+            value = self._remember(key, compute())
+        return value
+
+    def compress(self, start=START):
+        return self._cached(
+            ("compress", start), lambda: compress(self.flow_rate, self.neighbors, start)
+        )
 
-    return max(result, moving_score)
+    def pressures(self, time, start=START):
+        return self._cached(
+            ("pressures", start, time),
+            lambda: best_pressures(*self.compress(start), time),
+        )
 
+    def best_pressure(self, time=30, start=START):
+        return max(self.pressures(time, start).values())
 
-def part1():
-    with open("data/day16.txt", "r", encoding="utf-8") as data:
-        lines = data.readlines()
-        read_input(lines)
+    def best_pair_pressure(self, time=26, start=START):
+        return best_disjoint_pair(self.pressures(time, start))
 
-        return score("AA", 30, "")
 
+def part1(source=None):
+    with open_input(16, source) as data:
+        return ValveNetwork(data).best_pressure(30)
 
-def part2():
-    with open("data/day16.txt", "r", encoding="utf-8") as data:
-        lines = data.readlines()
-        read_input(lines)
 
-        return score2("AA", "AA", 26, "", False)
+def part2(source=None):
+    with open_input(16, source) as data:
+        return ValveNetwork(data).best_pair_pressure(26)
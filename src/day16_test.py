@@ -1,9 +1,108 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import day16
+from inputs import open_input
 
 
 def test_part1() -> None:
-    assert day16.part1() == 1650
+    assert day16.part1() == 1651
 
 
 def test_part2() -> None:
-    assert day16.part2() == 1706
+    assert day16.part2() == 1707
+
+
+def test_best_pressures() -> None:
+    with open_input(16) as data:
+        flows, distances = day16.compress(*day16.parse_valves(data))
+
+    assert len(flows) == 6
+    best = day16.best_pressures(flows, distances, 30)
+    assert best[0] == 0
+    assert max(best.values()) == 1651
+    assert day16.best_disjoint_pair(day16.best_pressures(flows, distances, 26)) == 1707
+
+
+def test_networks_are_independent() -> None:
+    with open_input(16) as data:
+        network = day16.ValveNetwork(data)
+
+    # the same valve names with different rates must not share memo entries
+    other = day16.ValveNetwork(
+        [
+            "Valve AA has flow rate=0; tunnels lead to valves BB",
+            "Valve BB has flow rate=5; tunnels lead to valves AA",
+        ]
+    )
+
+    assert network.best_pressure(30) == 1651
+    assert other.best_pressure(30) == 5 * 28
+    assert network.best_pressure(30) == 1651
+
+    network.clear_memo()
+    assert network.memo_len() == 0
+
+
+def test_shared_network_in_threads() -> None:
+    with open_input(16) as data:
+        lines = data.readlines()
+
+    fresh = day16.ValveNetwork(lines)
+    network = day16.ValveNetwork(lines, memo_size=2)
+
+    # with room for two entries the three tables keep evicting each other
+    times = [30, 26, 20] * 8
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        single = list(executor.map(network.best_pressure, times))
+        pairs = list(executor.map(network.best_pair_pressure, times))
+
+    assert network.memo_len() <= 2
+    assert single == [fresh.best_pressure(time) for time in times]
+    assert pairs == [fresh.best_pair_pressure(time) for time in times]
+    assert single[0] == 1651 and pairs[1] == 1707
+
+
+def test_unreachable_valves() -> None:
+    network = day16.ValveNetwork(
+        [
+            "Valve AA has flow rate=0; tunnels lead to valves BB",
+            "Valve BB has flow rate=0; tunnels lead to valves AA",
+            "Valve CC has flow rate=50; tunnels lead to valves DD",
+            "Valve DD has flow rate=0; tunnels lead to valves CC",
+        ]
+    )
+
+    assert network.best_pressure(30) == 0
+    assert network.best_pair_pressure(26) == 0
+
+
+def test_cached_tables(monkeypatch) -> None:
+    calls = []
+    best_pressures = day16.best_pressures
+
+    def counting(flows, distances, time):
+        calls.append(time)
+        return best_pressures(flows, distances, time)
+
+    monkeypatch.setattr(day16, "best_pressures", counting)
+
+    with open_input(16) as data:
+        network = day16.ValveNetwork(data, memo_size=2)
+
+    assert network.best_pressure(30) == 1651
+    assert network.best_pressure(30) == 1651
+    assert calls == [30]
+    assert network.memo_len() == 2
+
+    # building the 26 minute table uses the compressed graph, so the least
+    # recently used entry is the 30 minute table
+    assert network.best_pair_pressure(26) == 1707
+    assert network.memo_len() == 2
+    assert network.best_pair_pressure(26) == 1707
+    assert network.best_pressure(30) == 1651
+    assert calls == [30, 26, 30]
+
+    network.clear_memo()
+    assert network.memo_len() == 0
+    assert network.best_pressure(30) == 1651
+    assert calls == [30, 26, 30, 30]
@@ -3,7 +3,12 @@ from collections import namedtuple
 from operator import lshift, rshift
 from typing import Literal, Optional
 
-State = namedtuple("State", ["top_row", "jet_num", "shape_num"])
+from inputs import InputSource, open_input
+
+State = namedtuple("State", ["surface", "jet_num", "shape_num"])
+
+WIDTH = 7
+FULL_ROW = 0b1111111
 
 
 class Shape:
@@ -61,21 +66,106 @@ class Shape:
         return last_jet
 
 
-class BoardData:
+class Tower:
+    # keeps only the rows a falling rock can still reach; rows[0] is at
+    # absolute height base and everything below it counts as rock
     def __init__(self):
-        self.board = 10_000 * [0b0000000]
-        self.board[0] = 0b1111111
+        self.rows = bytearray([FULL_ROW])
+        self.base = 0
         self.height = 0
 
+    def __getitem__(self, y: int) -> int:
+        if y < self.base:
+            return FULL_ROW
+
+        idx = y - self.base
+        return self.rows[idx] if idx < len(self.rows) else 0
+
     def add_shape(self, shape: Shape) -> None:
         self.height = max(self.height, shape.height())
 
+        end = shape.height() + 1 - self.base
+        if end > len(self.rows):
+            self.rows.extend(bytes(end - len(self.rows)))
+
         for i, cell in enumerate(shape.cells):
-            self.board[shape.position + i] |= cell
+            self.rows[shape.position - self.base + i] |= cell
+
+    def window(self, y: int, rows: int) -> int:
+        # rows y .. y + rows - 1 packed one byte per row, lowest row first
+        if y < self.base:
+            below = min(rows, self.base - y)
+            rest = self.window(self.base, rows - below) if rows > below else 0
+            return int.from_bytes(bytes([FULL_ROW]) * below, "little") | (
+                rest << 8 * below
+            )
+
+        idx = y - self.base
+        return int.from_bytes(self.rows[idx : idx + rows], "little")
+
+    def place(self, y: int, rows: int, mask: int) -> None:
+        self.height = max(self.height, y + rows - 1)
+
+        idx = y - self.base
+        if idx + rows > len(self.rows):
+            self.rows.extend(bytes(idx + rows - len(self.rows)))
+
+        packed = int.from_bytes(self.rows[idx : idx + rows], "little") | mask
+        self.rows[idx : idx + rows] = packed.to_bytes(rows, "little")
+
+    def drop(self, masks: list[int], rows: int, jets: list[int], jet: int) -> int:
+        # masks[x] is the rock with its left edge in column x; returns the index
+        # of the next jet
+        x = 2
+        y = self.height + 4
+        num_of_jets = len(jets)
+
+        while True:
+            moved = x + jets[jet]
+            jet += 1
+            if jet == num_of_jets:
+                jet = 0
+
+            if 0 <= moved < len(masks) and not self.window(y, rows) & masks[moved]:
+                x = moved
+
+            if self.window(y - 1, rows) & masks[x]:
+                break
+            y -= 1
+
+        self.place(y, rows, masks[x])
+        return jet
+
+    def surface(self) -> tuple[int, ...]:
+        # every cell of a falling rock moves down, left or right through free
+        # cells from above the top, so the free cells reachable that way hold
+        # the whole future of the tower; they are swept row by row downwards
+        profile = []
+        reach = FULL_ROW
+        y = self.height
+
+        while True:
+            free = ~self[y] & FULL_ROW
+            reach &= free
+
+            while reach != (spread := (reach | reach << 1 | reach >> 1) & free):
+                reach = spread
+
+            if not reach:
+                break
+
+            profile.append(reach)
+            y -= 1
+
+        if y + 1 > self.base:
+            del self.rows[: y + 1 - self.base]
+            self.base = y + 1
+
+        return tuple(profile)
 
     def current_state(self, last_jet: int, last_shape: int) -> State:
         return State(
-            top_row=self.board[self.height],
+            surface=self.surface(),
             jet_num=last_jet,
             shape_num=last_shape,
         )
@@ -101,58 +191,79 @@ def get_square(position: int) -> Shape:
     return Shape(cells=[0b0011000, 0b0011000], position=position)
 
 
-def get_jets():
-    with open("data/day17.txt", "r", encoding="utf-8") as data:
-        line = data.readline()
-        jets_list = list(line.strip())
-        return itertools.cycle(enumerate(jets_list))
+def shape_masks(shape: Shape) -> list[int]:
+    # one mask per left edge column, the getters spawn rocks at column 2
+    packed = int.from_bytes(bytes(shape.cells), "little")
+    lowest_bit = min((cell & -cell).bit_length() - 1 for cell in shape.cells)
+    width = WIDTH - 2 - lowest_bit
 
+    return [
+        packed << (2 - x) if x < 2 else packed >> (x - 2)
+        for x in range(WIDTH - width + 1)
+    ]
 
-def get_shape_getters():
-    getters_list = [get_minus, get_plus, get_lshape, get_ishape, get_square]
-    return itertools.cycle(enumerate(getters_list))
 
+SHAPES = [
+    get(position=0) for get in (get_minus, get_plus, get_lshape, get_ishape, get_square)
+]
+SHAPE_MASKS = [shape_masks(shape) for shape in SHAPES]
+SHAPE_ROWS = [len(shape.cells) for shape in SHAPES]
 
-def try_to_simulate_cycle(curr_state, states, step, board_data, n) -> Optional[int]:
-    if curr_state in states:
-        prev_height, prev_step = states[curr_state]
-        cycle_len = step - prev_step
-        height_diff = board_data.height - prev_height
-        remaining_steps = n - step
 
-        cycles_left, remainder = divmod(remaining_steps, cycle_len)
+def read_jets(source: Optional[InputSource]) -> list[int]:
+    with open_input(17, source) as data:
+        return [1 if jet == ">" else -1 for jet in data.readline().strip()]
 
-        if remainder == 0:
-            return board_data.height + cycles_left * height_diff
 
-    states[curr_state] = board_data.height, step
+def get_jets(source: Optional[InputSource]):
+    with open_input(17, source) as data:
+        line = data.readline()
+        jets_list = list(line.strip())
+        return itertools.cycle(enumerate(jets_list))
 
-    return None
 
+def get_shape_getters():
+    getters_list = [get_minus, get_plus, get_lshape, get_ishape, get_square]
+    return itertools.cycle(enumerate(getters_list))
 
-def get_height(n: int) -> int:
-    jets = get_jets()
-    shape_getter = get_shape_getters()
-    board_data = BoardData()
+
+def get_height(
+    n: int, source: Optional[InputSource] = None, skip_cycles: bool = True
+) -> int:
+    jets = read_jets(source)
+    tower = Tower()
     states: dict[State, tuple[int, int]] = {}
+    skipped_height: Optional[int] = None
+    jet = 0
+    step = 0
+
+    while step < n:
+        shape = step % len(SHAPES)
+        step += 1
+        jet = tower.drop(SHAPE_MASKS[shape], SHAPE_ROWS[shape], jets, jet)
+        curr_state = tower.current_state(jet, shape)
 
-    for step in range(1, n + 1):
-        last_shape, shape = next(shape_getter)
-        shape = shape(position=board_data.height + 4)
+        if not skip_cycles or skipped_height is not None:
+            continue
 
-        last_jet = shape.perform_full_fall(board_data.board, jets)
-        board_data.add_shape(shape)
-        curr_state = board_data.current_state(last_jet, last_shape)
+        if curr_state in states:
+            # equal states evolve identically, so whole cycles are skipped and
+            # the remaining rocks are simulated as usual
+            prev_height, prev_step = states[curr_state]
+            cycle_len = step - prev_step
+            cycles = (n - step) // cycle_len
 
-        if result := try_to_simulate_cycle(curr_state, states, step, board_data, n):
-            return result
+            skipped_height = cycles * (tower.height - prev_height)
+            step += cycles * cycle_len
+        else:
+            states[curr_state] = tower.height, step
 
-    return board_data.height
+    return tower.height + (skipped_height or 0)
 
 
-def part1():
-    return get_height(2022)
+def part1(source=None):
+    return get_height(2022, source)
 
 
-def part2():
-    return get_height(1_000_000_000_000)
+def part2(source=None):
+    return get_height(1_000_000_000_000, source)
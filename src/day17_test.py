@@ -1,4 +1,7 @@
 import day17
+from inputs import LineSource
+
+EXAMPLE = ">>><<><>><<<>><>>><<<>>><<<><<<>><>><<>>\n"
 
 
 def test_part1() -> None:
@@ -7,3 +10,45 @@ def test_part1() -> None:
 
 def test_part2() -> None:
     assert day17.part2() == 1594842406882
+
+
+def test_example() -> None:
+    assert day17.get_height(2022, LineSource([EXAMPLE])) == 3068
+    assert day17.get_height(10**12, LineSource([EXAMPLE])) == 1514285714288
+    # cycles are skipped at any remainder, not only when they divide evenly
+    for n in (2023, 3001, 3002):
+        full = day17.get_height(n, LineSource([EXAMPLE]), skip_cycles=False)
+        assert full == day17.get_height(n, LineSource([EXAMPLE]))
+
+
+def test_tower_window() -> None:
+    tower = day17.Tower()
+    tower.add_shape(day17.get_minus(position=1))
+    tower.add_shape(day17.get_ishape(position=2))
+    tower.surface()
+
+    assert tower.height == 5
+    assert tower.base > 0
+    assert tower[0] == day17.FULL_ROW
+
+
+def test_mask_kernel() -> None:
+    jets = day17.get_jets(LineSource([EXAMPLE]))
+    shapes = day17.get_shape_getters()
+    reference = day17.Tower()
+
+    jet_list = day17.read_jets(LineSource([EXAMPLE]))
+    jet = 0
+    tower = day17.Tower()
+
+    for step in range(300):
+        _, get_shape = next(shapes)
+        shape = get_shape(position=reference.height + 4)
+        shape.perform_full_fall(reference, jets)
+        reference.add_shape(shape)
+
+        idx = step % len(day17.SHAPES)
+        jet = tower.drop(day17.SHAPE_MASKS[idx], day17.SHAPE_ROWS[idx], jet_list, jet)
+        assert tower.height == reference.height
+
+    assert tower.rows == reference.rows
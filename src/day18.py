@@ -1,3 +1,13 @@
+from collections import namedtuple
+
+from inputs import open_input
+
+# dense voxel volume packed into one int: voxel (x, y, z) of the padded box is
+# bit (x * size_y + y) * size_z + z, origin is the droplet voxel at (2, 2, 2)
+Volume = namedtuple("Volume", ["origin", "size", "solid", "inside"])
+Pocket = namedtuple("Pocket", ["size", "voxel"])
+
+
 def read_cube(line):
     words = line.strip().split(",")
     x, y, z = map(int, words)
@@ -36,14 +46,6 @@ def exterior_surface(cubes):
     return 6 * len(cubes) - common_sides
 
 
-def part1():
-    with open("data/day18.txt", "r", encoding="utf-8") as data:
-        lines = data.readlines()
-        cubes = read_input(lines)
-
-        return exterior_surface(cubes)
-
-
 def dict_add_zero_or_inc(d, key):
     if key in d:
         d[key] += 1
@@ -146,10 +148,173 @@ def fill_air_pockets(cubes):
     return space.difference(visited)
 
 
-def part2():
-    with open("data/day18.txt", "r", encoding="utf-8") as data:
-        lines = data.readlines()
-        cubes = read_input(lines)
-        filled = fill_air_pockets(cubes)
+def surface_area(cubes):
+    return sum(1 for cube in cubes for n in all_neighbors(cube) if n not in cubes)
+
+
+def outside_surface(cubes):
+    # flood the air in the bounding box grown by one; every step that runs
+    # into a cube crosses exactly one exterior face
+    max_all = find_max_coords(cubes)
+    min_all = find_min_coords(cubes, *max_all)
+    low = tuple(c - 1 for c in min_all)
+    high = tuple(c + 1 for c in max_all)
+
+    queue = [low]
+    visited = {low}
+    faces = 0
+
+    while queue:
+        for neighbor in all_neighbors(queue.pop()):
+            if neighbor in cubes:
+                faces += 1
+            elif neighbor not in visited and all(
+                lo <= c <= hi for lo, c, hi in zip(low, neighbor, high)
+            ):
+                visited.add(neighbor)
+                queue.append(neighbor)
+
+    return faces
+
+
+def repeat_bits(pattern, width, times):
+    return pattern * (((1 << (width * times)) - 1) // ((1 << width) - 1))
+
+
+def voxel_index(size, x, y, z):
+    _, size_y, size_z = size
+    return (x * size_y + y) * size_z + z
+
+
+def index_voxel(volume, idx):
+    _, size_y, size_z = volume.size
+    x, rest = divmod(idx, size_y * size_z)
+    y, z = divmod(rest, size_z)
+
+    return tuple(o + c for o, c in zip(volume.origin, (x, y, z)))
+
+
+def inside_mask(size):
+    # everything but the guard layer
+    size_x, size_y, size_z = size
+    plane = size_y * size_z
+
+    row = ((1 << (size_z - 2)) - 1) << 1
+    layer = repeat_bits(row, size_z, size_y - 2) << size_z
+    return repeat_bits(layer, plane, size_x - 2) << plane
+
+
+def solid_mask(cubes, origin, size):
+    size_x, size_y, size_z = size
+    bits = bytearray((size_x * size_y * size_z + 7) // 8)
+
+    for cube in cubes:
+        idx = voxel_index(size, *(c - o for c, o in zip(cube, origin)))
+        bits[idx >> 3] |= 1 << (idx & 7)
+
+    return int.from_bytes(bits, "little")
+
+
+def build_volume(cubes):
+    # the box gets one layer of air and one guard layer on every side; guard
+    # voxels are never inside, so shifted bits cannot wrap into the next row
+    max_all = find_max_coords(cubes)
+    min_all = find_min_coords(cubes, *max_all)
+    origin = tuple(lo - 2 for lo in min_all)
+    size = tuple(hi - lo + 5 for lo, hi in zip(min_all, max_all))
+
+    return Volume(origin, size, solid_mask(cubes, origin, size), inside_mask(size))
+
+
+def volume_steps(volume):
+    _, size_y, size_z = volume.size
+    return 1, size_z, size_y * size_z
+
+
+def dilate(mask, steps):
+    grown = mask
+    for step in steps:
+        grown |= mask << step | mask >> step
+    return grown
+
+
+def flood(seed, free, steps):
+    reach = seed
+    while reach != (grown := dilate(reach, steps) & free):
+        reach = grown
+    return reach
+
+
+def outside_air(volume):
+    corner = 1 << voxel_index(volume.size, 1, 1, 1)
+
+    return flood(corner, volume.inside & ~volume.solid, volume_steps(volume))
+
+
+def pocket_mask(volume):
+    return volume.inside & ~volume.solid & ~outside_air(volume)
+
+
+def set_bits(mask):
+    data = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+
+    for i, byte in enumerate(data):
+        while byte:
+            low = byte & -byte
+            yield 8 * i + low.bit_length() - 1
+            byte ^= low
+
+
+def take_pocket(first, remaining, steps):
+    # removes the pocket around first from remaining, returns its size
+    remaining.discard(first)
+    queue = [first]
+    size = 0
+
+    while queue:
+        idx = queue.pop()
+        size += 1
+        for step in steps:
+            for neighbor in (idx - step, idx + step):
+                if neighbor in remaining:
+                    remaining.discard(neighbor)
+                    queue.append(neighbor)
+
+    return size
+
+
+def air_pockets(volume):
+    # pockets are usually tiny, so they are split up sparsely; each one is
+    # represented by its lowest voxel
+    pockets = []
+    voxels = list(set_bits(pocket_mask(volume)))
+    remaining = set(voxels)
+    steps = volume_steps(volume)
+
+    for first in voxels:
+        if first in remaining:
+            size = take_pocket(first, remaining, steps)
+            pockets.append(Pocket(size, index_voxel(volume, first)))
+
+    return pockets
+
+
+def dense_outside_surface(volume):
+    outside = outside_air(volume)
+    faces = 0
+
+    for step in volume_steps(volume):
+        faces += ((outside << step) & volume.solid).bit_count()
+        faces += ((outside >> step) & volume.solid).bit_count()
+
+    return faces
+
+
+def part1(source=None):
+    with open_input(18, source) as data:
+        return surface_area(read_input(data))
+
 
-        return exterior_surface(filled)
+def part2(source=None):
+    with open_input(18, source) as data:
+        return dense_outside_surface(build_volume(read_input(data)))
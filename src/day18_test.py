@@ -1,4 +1,5 @@
 import day18
+from inputs import open_input
 
 
 def test_part1() -> None:
@@ -7,3 +8,33 @@ def test_part1() -> None:
 
 def test_part2() -> None:
     assert day18.part2() == 2006
+
+
+EXAMPLE = """2,2,2 1,2,2 3,2,2 2,1,2 2,3,2 2,2,1 2,2,3 2,2,4 2,2,6 1,2,5 3,2,5 2,1,5
+2,3,5""".split()
+
+
+def test_example() -> None:
+    cubes = day18.read_input(EXAMPLE)
+
+    assert day18.surface_area(cubes) == day18.exterior_surface(cubes) == 64
+    filled = day18.fill_air_pockets(cubes)
+    assert day18.outside_surface(cubes) == day18.exterior_surface(filled) == 58
+
+
+def test_dense_volume() -> None:
+    cubes = day18.read_input(EXAMPLE)
+    volume = day18.build_volume(cubes)
+
+    assert volume.solid.bit_count() == len(cubes)
+    assert day18.dense_outside_surface(volume) == 58
+    assert day18.air_pockets(volume) == [day18.Pocket(1, (2, 2, 5))]
+
+    with open_input(18) as data:
+        cubes = day18.read_input(data)
+
+    volume = day18.build_volume(cubes)
+    pockets = day18.air_pockets(volume)
+    assert day18.dense_outside_surface(volume) == 2006
+    assert sum(p.size for p in pockets) == day18.pocket_mask(volume).bit_count()
+    assert all(p.voxel not in cubes for p in pockets)
@@ -1,9 +1,13 @@
 import re
-import functools
 import math
+import os
+import time
 
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from inputs import InputSource, open_input
 
 
 OreCost = namedtuple("OreCost", ["ore"])
@@ -13,8 +17,10 @@ GeodeCost = namedtuple("GeodeCost", ["ore", "obsidian"])
 Blueprint = namedtuple(
     "Blueprint", ["idx", "ore_cost", "clay_cost", "obsidian_cost", "geode_cost"]
 )
-Mineral = namedtuple("Mineral", ["ore", "clay", "obsidian", "geode"])
-State = namedtuple("State", ["time_left", "num_of_mineral", "num_of_robots"])
+Minerals = tuple[int, int, int]
+BlueprintReport = namedtuple(
+    "BlueprintReport", ["idx", "geodes", "quality", "seconds", "states"]
+)
 
 
 def read_blueprint(line) -> Blueprint:
@@ -30,177 +36,187 @@ def read_blueprint(line) -> Blueprint:
     )
 
 
-def read_input() -> list[Blueprint]:
-    with open("data/day19.txt", "r", encoding="utf-8") as data:
+def read_input(source: Optional[InputSource] = None) -> list[Blueprint]:
+    with open_input(19, source) as data:
         lines = data.readlines()
         return [read_blueprint(line.strip()) for line in lines]
 
 
-def default_state(time_left: int) -> State:
-    return State(
-        time_left=time_left,
-        num_of_mineral=Mineral(ore=0, clay=0, obsidian=0, geode=0),
-        num_of_robots=Mineral(ore=1, clay=0, obsidian=0, geode=0),
-    )
-
-
-def can_buy_geode(blueprint: Blueprint, state: State) -> bool:
-    return (
-        state.num_of_mineral.ore >= blueprint.geode_cost.ore
-        and state.num_of_mineral.obsidian >= blueprint.geode_cost.obsidian
-    )
-
-
-def try_buy_geode(blueprint: Blueprint, state: State) -> Optional[State]:
-    if (
-        state.num_of_mineral.ore < blueprint.geode_cost.ore
-        or state.num_of_mineral.obsidian < blueprint.geode_cost.obsidian
-    ):
-        return None
-
-    return State(
-        time_left=state.time_left - 1,
-        num_of_mineral=Mineral(
-            ore=state.num_of_mineral.ore
-            - blueprint.geode_cost.ore
-            + state.num_of_robots.ore,
-            clay=state.num_of_mineral.clay + state.num_of_robots.clay,
-            obsidian=state.num_of_mineral.obsidian
-            - blueprint.geode_cost.obsidian
-            + state.num_of_robots.obsidian,
-            geode=state.num_of_mineral.geode + state.num_of_robots.geode,
-        ),
-        num_of_robots=Mineral(
-            ore=state.num_of_robots.ore,
-            clay=state.num_of_robots.clay,
-            obsidian=state.num_of_robots.obsidian,
-            geode=state.num_of_robots.geode + 1,
-        ),
-    )
-
-
-def try_buy_obsidian(blueprint: Blueprint, state: State) -> Optional[State]:
-    if (
-        state.num_of_mineral.ore < blueprint.obsidian_cost.ore
-        or state.num_of_mineral.clay < blueprint.obsidian_cost.clay
-    ):
-        return None
-
-    return State(
-        time_left=state.time_left - 1,
-        num_of_mineral=Mineral(
-            ore=state.num_of_mineral.ore
-            - blueprint.obsidian_cost.ore
-            + state.num_of_robots.ore,
-            clay=state.num_of_mineral.clay
-            - blueprint.obsidian_cost.clay
-            + state.num_of_robots.clay,
-            obsidian=state.num_of_mineral.obsidian + state.num_of_robots.obsidian,
-            geode=state.num_of_mineral.geode + state.num_of_robots.geode,
-        ),
-        num_of_robots=Mineral(
-            ore=state.num_of_robots.ore,
-            clay=state.num_of_robots.clay,
-            obsidian=state.num_of_robots.obsidian + 1,
-            geode=state.num_of_robots.geode,
-        ),
+def build_time(cost: Minerals, stock: Minerals, robots: Minerals, minutes: int) -> int:
+    # minutes left once a robot with this cost is built, 0 or less if it never
+    # can be built in time
+    wait = 0
+
+    for need, have, rate in zip(cost, stock, robots):
+        if need > have:
+            if not rate:
+                return 0
+            wait = max(wait, -(-(need - have) // rate))
+
+    return minutes - wait - 1
+
+
+def geode_bound(minutes: int, obsidian: int, obs_bots: int, cost: int) -> int:
+    # relaxed factory with free ore and clay that adds an obsidian robot every
+    # minute and a geode robot whenever the obsidian suffices
+    geodes = 0
+
+    for left in range(minutes - 1, 0, -1):
+        if obsidian >= cost:
+            obsidian -= cost
+            geodes += left
+        obsidian += obs_bots
+        obs_bots += 1
+
+    return geodes
+
+
+STATE_BITS = 16
+DEFAULT_MEMO_SIZE = 1 << 20
+
+
+def pack_state(*fields: int) -> int:
+    key = 0
+    for field in fields:
+        key = key << STATE_BITS | field
+    return key
+
+
+class GeodeSearch:
+    # one blueprint with its own memo of visited states; the memo is emptied
+    # for every run and whenever it grows past memo_size
+    def __init__(self, blueprint: Blueprint, memo_size: int = DEFAULT_MEMO_SIZE):
+        self.blueprint = blueprint
+        self.memo_size = memo_size
+        self.memo: dict[int, int] = {}
+        self.states = 0
+
+    def clear(self) -> None:
+        self.memo.clear()
+
+    def recipes(self) -> list[tuple[Minerals, Optional[int], int]]:
+        # (cost, index of the collecting robot, cap on that robot kind) with
+        # minerals as ore, clay, obsidian; the geode robot comes first
+        ore_cost = self.blueprint.ore_cost.ore
+        clay_cost = self.blueprint.clay_cost.ore
+        obsidian_ore, obsidian_clay = self.blueprint.obsidian_cost
+        geode_ore, geode_obsidian = self.blueprint.geode_cost
+
+        # a factory builds one robot per minute, so once the robots and the
+        # stock of a mineral cover its largest price in every remaining minute,
+        # more robots of that kind can never be spent
+        max_ore = max(ore_cost, clay_cost, obsidian_ore, geode_ore)
+
+        return [
+            ((geode_ore, 0, geode_obsidian), None, 0),
+            ((obsidian_ore, obsidian_clay, 0), 2, geode_obsidian),
+            ((clay_cost, 0, 0), 1, obsidian_clay),
+            ((ore_cost, 0, 0), 0, max_ore),
+        ]
+
+    def run(self, time_left: int) -> int:
+        recipes = self.recipes()
+        geode_obsidian = self.blueprint.geode_cost.obsidian
+        best = 0
+        memo = self.memo
+        memo.clear()
+        self.states = 0
+
+        def search(minutes: int, stock: Minerals, robots: Minerals, geodes: int):
+            # geodes already counts everything the built geode robots will crack
+            nonlocal best
+            best = max(best, geodes)
+
+            # the same state reached again with no more geodes has nothing to add
+            key = pack_state(minutes, *stock, *robots)
+            if memo.get(key, -1) >= geodes:
+                return
+            if len(memo) >= self.memo_size:
+                memo.clear()
+            memo[key] = geodes
+            self.states += 1
+
+            bound = geode_bound(minutes, stock[2], robots[2], geode_obsidian)
+            if geodes + bound <= best:
+                return
+
+            # jump straight to the next build of each kind instead of idling
+            for cost, kind, cap in recipes:
+                if kind is not None and (
+                    robots[kind] * minutes + stock[kind] >= cap * minutes
+                ):
+                    continue
+
+                if (left := build_time(cost, stock, robots, minutes)) <= 0:
+                    continue
+
+                elapsed = minutes - left
+                after = (
+                    stock[0] + robots[0] * elapsed - cost[0],
+                    stock[1] + robots[1] * elapsed - cost[1],
+                    stock[2] + robots[2] * elapsed - cost[2],
+                )
+
+                if kind is None:
+                    search(left, after, robots, geodes + left)
+                else:
+                    more = (
+                        robots[0] + (kind == 0),
+                        robots[1] + (kind == 1),
+                        robots[2] + (kind == 2),
+                    )
+                    search(left, after, more, geodes)
+
+        search(time_left, (0, 0, 0), (1, 0, 0), 0)
+        return best
+
+
+def best_geodes(blueprint: Blueprint, time_left: int) -> int:
+    return GeodeSearch(blueprint).run(time_left)
+
+
+def evaluate_blueprint(blueprint: Blueprint, time_left: int) -> BlueprintReport:
+    search = GeodeSearch(blueprint)
+    start = time.perf_counter()
+    geodes = search.run(time_left)
+
+    return BlueprintReport(
+        idx=blueprint.idx,
+        geodes=geodes,
+        quality=blueprint.idx * geodes,
+        seconds=time.perf_counter() - start,
+        states=search.states,
     )
 
 
-def try_buy_clay(blueprint: Blueprint, state: State) -> Optional[State]:
-    if state.num_of_mineral.ore < blueprint.clay_cost.ore:
-        return None
-
-    return State(
-        time_left=state.time_left - 1,
-        num_of_mineral=Mineral(
-            ore=state.num_of_mineral.ore
-            - blueprint.clay_cost.ore
-            + state.num_of_robots.ore,
-            clay=state.num_of_mineral.clay + state.num_of_robots.clay,
-            obsidian=state.num_of_mineral.obsidian + state.num_of_robots.obsidian,
-            geode=state.num_of_mineral.geode + state.num_of_robots.geode,
-        ),
-        num_of_robots=Mineral(
-            ore=state.num_of_robots.ore,
-            clay=state.num_of_robots.clay + 1,
-            obsidian=state.num_of_robots.obsidian,
-            geode=state.num_of_robots.geode,
-        ),
-    )
-
-
-def try_buy_ore(blueprint: Blueprint, state: State) -> Optional[State]:
-    if state.num_of_mineral.ore < blueprint.ore_cost.ore:
-        return None
-
-    return State(
-        time_left=state.time_left - 1,
-        num_of_mineral=Mineral(
-            ore=state.num_of_mineral.ore
-            - blueprint.ore_cost.ore
-            + state.num_of_robots.ore,
-            clay=state.num_of_mineral.clay + state.num_of_robots.clay,
-            obsidian=state.num_of_mineral.obsidian + state.num_of_robots.obsidian,
-            geode=state.num_of_mineral.geode + state.num_of_robots.geode,
-        ),
-        num_of_robots=Mineral(
-            ore=state.num_of_robots.ore + 1,
-            clay=state.num_of_robots.clay,
-            obsidian=state.num_of_robots.obsidian,
-            geode=state.num_of_robots.geode,
-        ),
-    )
-
-
-def no_buy(state: State) -> State:
-    return State(
-        time_left=state.time_left - 1,
-        num_of_mineral=Mineral(
-            ore=state.num_of_mineral.ore + state.num_of_robots.ore,
-            clay=state.num_of_mineral.clay + state.num_of_robots.clay,
-            obsidian=state.num_of_mineral.obsidian + state.num_of_robots.obsidian,
-            geode=state.num_of_mineral.geode + state.num_of_robots.geode,
-        ),
-        num_of_robots=Mineral(
-            ore=state.num_of_robots.ore,
-            clay=state.num_of_robots.clay,
-            obsidian=state.num_of_robots.obsidian,
-            geode=state.num_of_robots.geode,
-        ),
-    )
-
-
-@functools.cache
-def max_geode(blueprint: Blueprint, state: State) -> int:
-    if state.time_left == 0:
-        return state.num_of_mineral.geode
-
-    if geode_bought := try_buy_geode(blueprint, state):
-        return max_geode(blueprint, geode_bought)
-
-    if obsidian_bought := try_buy_obsidian(blueprint, state):
-        return max_geode(blueprint, obsidian_bought)
-
-    nothing_bought = no_buy(state)
-    possible_outcomes = [max_geode(blueprint, nothing_bought)]
+def evaluate_blueprints(
+    blueprints: Iterable[Blueprint], time_left: int, workers: Optional[int] = None
+) -> Iterator[BlueprintReport]:
+    # reports arrive in completion order; every worker builds its own searches
+    workers = workers or os.cpu_count() or 1
 
-    if clay_bought := try_buy_clay(blueprint, state):
-        possible_outcomes.append(max_geode(blueprint, clay_bought))
+    if workers == 1:
+        for blueprint in blueprints:
+            yield evaluate_blueprint(blueprint, time_left)
+        return
 
-    if ore_bought := try_buy_ore(blueprint, state):
-        possible_outcomes.append(max_geode(blueprint, ore_bought))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(evaluate_blueprint, blueprint, time_left)
+            for blueprint in blueprints
+        ]
 
-    return max(possible_outcomes)
+        for future in as_completed(futures):
+            yield future.result()
 
 
-def part1():
-    blueprints = read_input()
-    state = default_state(24)
-    return sum(map(lambda bp: bp.idx * max_geode(bp, state), blueprints))
+def part1(source=None):
+    blueprints = read_input(source)
+    reports = evaluate_blueprints(blueprints, 24, workers=1)
+    return sum(report.quality for report in reports)
 
 
-def part2():
-    blueprints = read_input()
-    state = default_state(24)  # 32
-    return math.prod(map(lambda bp: max_geode(bp, state), blueprints[:3]))
+def part2(source=None):
+    blueprints = read_input(source)
+    reports = evaluate_blueprints(blueprints[:3], 32, workers=1)
+    return math.prod(report.geodes for report in reports)
@@ -6,4 +6,41 @@ def test_part1() -> None:
 
 
 def test_part2() -> None:
-    assert day19.part2() == 972
+    assert day19.part2() == 56 * 62 * 56
+
+
+def test_best_geodes() -> None:
+    # the first two blueprints are the ones from the puzzle statement
+    first, second = day19.read_input()[:2]
+
+    assert day19.best_geodes(first, 24) == 9
+    assert day19.best_geodes(second, 24) == 12
+    assert day19.best_geodes(first, 32) == 56
+    assert day19.best_geodes(second, 32) == 62
+    assert day19.best_geodes(first, 1) == 0
+
+
+def test_geode_search_memo() -> None:
+    blueprint = day19.read_input()[0]
+    search = day19.GeodeSearch(blueprint, memo_size=100)
+
+    assert search.run(24) == 9
+    assert 0 < len(search.memo) <= 100
+    assert search.states > 100
+
+    search.clear()
+    assert not search.memo
+    assert day19.pack_state(1, 2) == 1 << day19.STATE_BITS | 2
+
+
+def test_evaluate_blueprints() -> None:
+    blueprints = day19.read_input()
+    serial = list(day19.evaluate_blueprints(blueprints, 24, workers=1))
+    parallel = list(day19.evaluate_blueprints(blueprints, 24, workers=2))
+
+    assert [report.idx for report in serial] == [1, 2, 3, 4]
+    assert sorted(report.quality for report in parallel) == sorted(
+        report.quality for report in serial
+    )
+    assert sum(report.quality for report in serial) == day19.part1()
+    assert all(report.states > 0 and report.seconds >= 0 for report in parallel)
@@ -1,9 +1,12 @@
+from inputs import open_input
+
+
 player_to_points = {"X": 0, "Y": 1, "Z": 2}
 opponent_to_points = {"A": 1, "B": 0, "C": 2}
 
 
-def part1():
-    with open("data/day2.txt", "r", encoding="utf-8") as data:
+def part1(source=None):
+    with open_input(2, source) as data:
         lines = data.readlines()
         curr_sum = 0
 
@@ -33,6 +36,6 @@ pair_to_points = {
 }
 
 
-def part2():
-    with open("data/day2.txt", "r", encoding="utf-8") as data:
+def part2(source=None):
+    with open_input(2, source) as data:
         return sum(pair_to_points[l[:3]] for l in data.readlines())
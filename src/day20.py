@@ -1,11 +1,17 @@
 import copy
 from collections import namedtuple
+from math import isqrt
+from typing import Optional
+
+from inputs import InputSource, open_input
 
 Node = namedtuple("Node", ["orig_idx", "value"])
 
 
-def read_input(factor: int = 1) -> list[Node]:
-    with open("data/day20.txt", "r", encoding="utf-8") as data:
+def read_input(
+    factor: int = 1, source: Optional[InputSource] = None
+) -> list[Node]:
+    with open_input(20, source) as data:
         number_arr = [factor * int(line.strip()) for line in data.readlines()]
         return [Node(i, v) for i, v in enumerate(number_arr)]
 
@@ -28,16 +34,72 @@ def perform_shuffle(nodes: list[Node], times: int = 1) -> None:
             nodes.insert(new_idx, node)
 
 
-def part1():
-    nodes = read_input()
-    perform_shuffle(nodes)
+class BlockList:
+    # sqrt decomposition: every node knows its block, so finding and moving a
+    # node costs O(sqrt(n)) instead of the O(n) scan of a flat list
+    def __init__(self, nodes: list[Node]):
+        self.block_size = max(1, isqrt(len(nodes)))
+        self.blocks: list[list[Node]] = []
+        self.block_of: dict[Node, int] = {}
+        self.inserts = 0
+        self.rebuild(nodes)
+
+    def rebuild(self, nodes: list[Node]) -> None:
+        size = self.block_size
+        self.blocks = [nodes[i : i + size] for i in range(0, len(nodes), size)]
+        self.block_of = {
+            node: b for b, block in enumerate(self.blocks) for node in block
+        }
+        self.inserts = 0
+
+    def to_list(self) -> list[Node]:
+        return [node for block in self.blocks for node in block]
+
+    def pop(self, node: Node) -> int:
+        b = self.block_of[node]
+        block = self.blocks[b]
+        inner_idx = block.index(node)
+        block.pop(inner_idx)
+
+        return sum(len(self.blocks[i]) for i in range(b)) + inner_idx
+
+    def insert(self, idx: int, node: Node) -> None:
+        for b, block in enumerate(self.blocks):
+            if idx <= len(block):
+                block.insert(idx, node)
+                self.block_of[node] = b
+                break
+            idx -= len(block)
+
+        # blocks drift apart in size, even them out every block_size moves
+        self.inserts += 1
+        if self.inserts >= self.block_size:
+            self.rebuild(self.to_list())
+
+
+def perform_shuffle_blocked(nodes: list[Node], times: int = 1) -> None:
+    n = len(nodes)
+    blocks = BlockList(nodes)
+
+    for _ in range(times):
+        for node in nodes:
+            curr_idx = blocks.pop(node)
+            new_idx = (curr_idx + node.value) % (n - 1)
+            blocks.insert(new_idx, node)
+
+    nodes[:] = blocks.to_list()
+
+
+def part1(source=None):
+    nodes = read_input(source=source)
+    perform_shuffle_blocked(nodes)
     return calculate_grove_coords(nodes)
 
 
 DECRYPTION_KEY = 811589153
 
 
-def part2():
-    nodes = read_input(factor=DECRYPTION_KEY)
-    perform_shuffle(nodes, times=10)
+def part2(source=None):
+    nodes = read_input(factor=DECRYPTION_KEY, source=source)
+    perform_shuffle_blocked(nodes, times=10)
     return calculate_grove_coords(nodes)
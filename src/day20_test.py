@@ -7,3 +7,12 @@ def test_part1() -> None:
 
 def test_part2() -> None:
     assert day20.part2() == 1640221678213
+
+
+def test_blocked_shuffle() -> None:
+    for factor, times in [(1, 1), (day20.DECRYPTION_KEY, 3)]:
+        reference = day20.read_input(factor)
+        blocked = list(reference)
+        day20.perform_shuffle(reference, times)
+        day20.perform_shuffle_blocked(blocked, times)
+        assert blocked == reference
@@ -1,4 +1,8 @@
+import heapq
 from dataclasses import dataclass
+from typing import Optional
+
+from inputs import open_input
 
 
 @dataclass
@@ -51,42 +55,9 @@ def eval_monkey(monkeys, key):
     return operation(left, right)
 
 
-def contains_key(monkeys, start_key, key):
-    if start_key == key:
-        return True
-
-    if monkeys[start_key].left is None:
-        return False
-
-    left_contains = contains_key(monkeys, monkeys[start_key].left, key)
-    right_contains = contains_key(monkeys, monkeys[start_key].right, key)
-
-    return left_contains or right_contains
-
-
 ROOT = "root"
 HUMAN = "humn"
 
-
-def part1():
-    with open("data/day21.txt", "r", encoding="utf-8") as data:
-        lines = data.readlines()
-        monkeys = read_input(lines)
-        return eval_monkey(monkeys, ROOT)
-
-
-def starter_parameters(monkeys):
-    left = monkeys[ROOT].left
-    right = monkeys[ROOT].right
-
-    if contains_key(monkeys, left, HUMAN):
-        return left, eval_monkey(monkeys, right)
-    if contains_key(monkeys, right, HUMAN):
-        return right, eval_monkey(monkeys, left)
-
-    raise ValueError("No starter parameters found")
-
-
 reverse_with_right = {
     "+": lambda v, r: v - r,
     "-": lambda v, r: v + r,
@@ -102,29 +73,150 @@ reverse_with_left = {
 }
 
 
-def find_human(monkeys, key, v):
-    if key == HUMAN:
-        return v
+class MonkeyGraph:
+    # monkeys as an array-indexed DAG, leaves have no operands
+    def __init__(self, lines):
+        specs = [line.split() for line in lines if line.strip()]
+
+        self.index = {words[0][:-1]: i for i, words in enumerate(specs)}
+        self.ops: list[Optional[str]] = [None] * len(specs)
+        self.operands: list[tuple[int, ...]] = [()] * len(specs)
+        self.values = [0] * len(specs)
+
+        for i, words in enumerate(specs):
+            if len(words) == 2:
+                self.values[i] = int(words[1])
+            else:
+                self.ops[i] = words[2]
+                self.operands[i] = (self.index[words[1]], self.index[words[3]])
+
+        self.parents: list[list[int]] = [[] for _ in specs]
+        for node in range(len(specs)):
+            for child in self.operands[node]:
+                self.parents[child].append(node)
+
+        self.order = self.topological_order()
+        self.position = [0] * len(specs)
+        for i, node in enumerate(self.order):
+            self.position[node] = i
+
+        self.evaluate()
+
+    def topological_order(self):
+        # iterative post-order, every monkey comes after both of its operands
+        order = []
+        state = bytearray(len(self.values))
+
+        for start in range(len(self.values)):
+            stack = [start]
+
+            while stack:
+                node = stack[-1]
+
+                if state[node] == 0:
+                    state[node] = 1
+                    stack.extend(c for c in self.operands[node] if not state[c])
+                else:
+                    stack.pop()
+                    if state[node] == 1:
+                        state[node] = 2
+                        order.append(node)
+
+        return order
+
+    def evaluate(self):
+        values = self.values
+
+        for node in self.order:
+            if (op := self.ops[node]) is not None:
+                left, right = self.operands[node]
+                values[node] = operations[op](values[left], values[right])
+
+    def update(self, leaves, root=ROOT):
+        # only ancestors of changed leaves are recomputed, in topological order
+        # so every monkey sees its final operands; unchanged results stop the
+        # propagation early
+        values = self.values
+        queued = set()
+        dirty: list[tuple[int, int]] = []
+
+        def mark_parents(node):
+            for parent in self.parents[node]:
+                if parent not in queued:
+                    queued.add(parent)
+                    heapq.heappush(dirty, (self.position[parent], parent))
+
+        # every name is checked before anything changes, a rejected batch
+        # leaves the cached values untouched
+        for name in leaves:
+            if name not in self.index or self.ops[self.index[name]] is not None:
+                raise ValueError(f"{name} is not a leaf")
+
+        for name, value in leaves.items():
+            node = self.index[name]
+            if values[node] != value:
+                values[node] = value
+                mark_parents(node)
+
+        while dirty:
+            _, node = heapq.heappop(dirty)
+            left, right = self.operands[node]
+            value = operations[self.ops[node]](values[left], values[right])
+
+            if value != values[node]:
+                values[node] = value
+                mark_parents(node)
+
+        return self.value(root)
+
+    def value(self, name):
+        return self.values[self.index[name]]
+
+    def depends_on(self, name):
+        target = self.index[name]
+        depends = [False] * len(self.values)
+
+        for node in self.order:
+            depends[node] = node == target or any(
+                depends[child] for child in self.operands[node]
+            )
+
+        return depends
+
+    def solve_for(self, name, root=ROOT):
+        # the root only compares its operands, so the side depending on name
+        # has to match the other one; walking down keeps the value the
+        # dependent side must take while the other side is already evaluated
+        depends = self.depends_on(name)
+        goal = self.index[name]
+        node = self.index[root]
+
+        if node == goal or not depends[node]:
+            raise ValueError(f"{root} does not depend on {name}")
+
+        left, right = self.operands[node]
+        if depends[left]:
+            node, target = left, self.values[right]
+        else:
+            node, target = right, self.values[left]
+
+        while node != goal:
+            op = self.ops[node]
+            left, right = self.operands[node]
 
-    left = monkeys[key].left
-    right = monkeys[key].right
+            if depends[left]:
+                node, target = left, reverse_with_right[op](target, self.values[right])
+            else:
+                node, target = right, reverse_with_left[op](self.values[left], target)
 
-    if contains_key(monkeys, left, HUMAN):
-        r = eval_monkey(monkeys, right)
-        reverse_fun = reverse_with_right[monkeys[key].op]
-        return find_human(monkeys, left, reverse_fun(v, r))
+        return target
 
-    if contains_key(monkeys, right, HUMAN):
-        l = eval_monkey(monkeys, left)
-        reverse_fun = reverse_with_left[monkeys[key].op]
-        return find_human(monkeys, right, reverse_fun(l, v))
 
-    raise ValueError("No human found")
+def part1(source=None):
+    with open_input(21, source) as data:
+        return MonkeyGraph(data).value(ROOT)
 
 
-def part2():
-    with open("data/day21.txt", "r", encoding="utf-8") as data:
-        lines = data.readlines()
-        monkeys = read_input(lines)
-        subtree, value = starter_parameters(monkeys)
-        return find_human(monkeys, subtree, value)
+def part2(source=None):
+    with open_input(21, source) as data:
+        return MonkeyGraph(data).solve_for(HUMAN)
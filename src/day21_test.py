@@ -1,3 +1,5 @@
+import pytest
+
 import day21
 
 
@@ -7,3 +9,71 @@ def test_part1() -> None:
 
 def test_part2() -> None:
     assert day21.part2() == 3759566892641
+
+
+EXAMPLE = """root: pppw + sjmn
+dbpl: 5
+cczh: sllz + lgvd
+zczc: 2
+ptdq: humn - dvpt
+dvpt: 3
+lfqf: 4
+humn: 5
+ljgn: 2
+sjmn: drzm * dbpl
+sllz: 4
+pppw: cczh / lfqf
+lgvd: ljgn * ptdq
+drzm: hmdt - zczc
+hmdt: 32""".splitlines()
+
+
+def test_monkey_graph() -> None:
+    graph = day21.MonkeyGraph(EXAMPLE)
+
+    assert graph.value("root") == 152
+    assert graph.value("root") == day21.eval_monkey(day21.read_input(EXAMPLE), "root")
+    assert graph.solve_for("humn") == 301
+
+
+def test_deep_chain() -> None:
+    # far deeper than the recursion limit
+    depth = 5000
+    lines = ["root: m0 + zero", "zero: 0", "one: 1", f"m{depth}: humn + zero"]
+    lines += [f"m{i}: m{i + 1} + one" for i in range(depth)]
+    lines.append("humn: 2")
+    graph = day21.MonkeyGraph(lines)
+
+    assert graph.value("m0") == 2 + depth
+    assert graph.solve_for("humn") == -depth
+
+
+def test_incremental_update() -> None:
+    graph = day21.MonkeyGraph(EXAMPLE)
+
+    for humn in (301, 7, 5):
+        changed = [f"humn: {humn}" if line[:4] == "humn" else line for line in EXAMPLE]
+        fresh = day21.MonkeyGraph(changed)
+        assert graph.update({"humn": humn}) == fresh.value("root")
+        assert graph.values == fresh.values
+
+    assert graph.update({"humn": 301, "hmdt": 32}) == 2 * 150
+    assert graph.update({"humn": 301, "hmdt": 42}, root="drzm") == 40
+
+    with pytest.raises(ValueError):
+        graph.update({"root": 1})
+
+
+def test_rejected_update() -> None:
+    graph = day21.MonkeyGraph(EXAMPLE)
+
+    for leaves in ({"humn": 7, "root": 1}, {"humn": 7, "nope": 1}):
+        with pytest.raises(ValueError):
+            graph.update(leaves)
+        assert graph.value("humn") == 5
+        assert graph.value("root") == 152
+
+    fresh = day21.MonkeyGraph(
+        ["humn: 7" if line[:4] == "humn" else line for line in EXAMPLE]
+    )
+    assert graph.update({"humn": 7}) == fresh.value("root") == 153
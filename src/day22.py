@@ -5,6 +5,8 @@ from enum import IntEnum
 from math import gcd
 from typing import Generator, Optional
 
+from inputs import InputSource, open_input
+
 
 class DirectionChange(IntEnum):
     L = 3
@@ -398,17 +400,19 @@ def general_solution(
     return final_password(position, direction, board.face_side)
 
 
-def read_input() -> tuple[Board, list[Instruction]]:
-    with open("data/day22.txt", "r", encoding="utf-8") as data:
+def read_input(
+    source: Optional[InputSource] = None,
+) -> tuple[Board, list[Instruction]]:
+    with open_input(22, source) as data:
         lines = data.readlines()
         return Board(lines[:-2]), read_instructions(lines[-1])
 
 
-def part1():
-    board, instructions = read_input()
+def part1(source=None):
+    board, instructions = read_input(source)
     return general_solution(board, instructions, FallCorrector(board))
 
 
-def part2():
-    board, instructions = read_input()
+def part2(source=None):
+    board, instructions = read_input(source)
     return general_solution(board, instructions, CubeCorrector(board))
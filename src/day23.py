@@ -1,5 +1,7 @@
 from enum import Enum
 
+from inputs import open_input
+
 Cardinal = Enum("Cardinal", ["NORTH", "EAST", "SOUTH", "WEST"])
 
 neighbors = {
@@ -108,8 +110,8 @@ def read_elves(lines):
     return elves
 
 
-def part1():
-    with open("data/day23.txt", "r", encoding="utf-8") as data:
+def part1(source=None):
+    with open_input(23, source) as data:
         lines = data.readlines()
         elves = read_elves(lines)
 
@@ -119,8 +121,8 @@ def part1():
         return find_empty_spaces(elves)
 
 
-def part2():
-    with open("data/day23.txt", "r", encoding="utf-8") as data:
+def part2(source=None):
+    with open_input(23, source) as data:
         lines = data.readlines()
         elves = read_elves(lines)
 
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from enum import Enum
 
+from inputs import open_input
+
 Direction = Enum("Direction", ["U", "D", "L", "R"])
 
 direction_to_move = {
@@ -109,16 +111,16 @@ def read_input(lines):
     return blizzards, mod_x, mod_y
 
 
-def part1():
-    with open("data/day24.txt", "r", encoding="utf-8") as data:
+def part1(source=None):
+    with open_input(24, source) as data:
         lines = data.readlines()
         blizzards, mod_x, mod_y = read_input(lines)
         basin = Basin(blizzards, mod_x, mod_y)
         return basin.run_simulation()
 
 
-def part2():
-    with open("data/day24.txt", "r", encoding="utf-8") as data:
+def part2(source=None):
+    with open_input(24, source) as data:
         lines = data.readlines()
         blizzards, mod_x, mod_y = read_input(lines)
         starting, ending = (-1, 0), (mod_x, mod_y - 1)
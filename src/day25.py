@@ -1,3 +1,6 @@
+from inputs import open_input
+
+
 def snafu_decode(snafu: str) -> int:
     snafu_to_digit = {
         "2": 2,
@@ -40,8 +43,8 @@ def snafu_encode(number: int) -> str:
     return snafu
 
 
-def part1():
-    with open("data/day25.txt", "r", encoding="utf-8") as data:
+def part1(source=None):
+    with open_input(25, source) as data:
         lines = data.readlines()
         normal_sum = sum(snafu_decode(line.strip()) for line in lines)
         return snafu_encode(normal_sum)
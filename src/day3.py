@@ -1,3 +1,6 @@
+from inputs import open_input
+
+
 def char_to_idx(c):
     if ord("a") <= ord(c):
         return ord(c) - ord("a")
@@ -21,14 +24,14 @@ def line_to_points(line):
     return 0
 
 
-def part1():
-    with open("data/day3.txt", "r", encoding="utf-8") as data:
+def part1(source=None):
+    with open_input(3, source) as data:
         lines = data.readlines()
         return sum(line_to_points(line) for line in lines)
 
 
-def part2():
-    with open("data/day3.txt", "r", encoding="utf-8") as data:
+def part2(source=None):
+    with open_input(3, source) as data:
         lines = data.readlines()
         length = len(lines)
         result = 0
@@ -1,4 +1,6 @@
-from typing import Callable
+from typing import Callable, Optional
+
+from inputs import InputSource, open_input
 
 
 class Pair:
@@ -28,16 +30,18 @@ class Pair:
         return not (x_last < y_first or y_last < x_first)
 
 
-def _general_solution(condition: Callable[[Pair], bool]) -> int:
-    with open("data/day4.txt", "r", encoding="utf-8") as data:
+def _general_solution(
+    condition: Callable[[Pair], bool], source: Optional[InputSource]
+) -> int:
+    with open_input(4, source) as data:
         lines = data.readlines()
         pairs = [Pair(line) for line in lines]
         return sum(1 for p in pairs if condition(p))
 
 
-def part1() -> int:
-    return _general_solution(Pair.either_is_contained)
+def part1(source: Optional[InputSource] = None) -> int:
+    return _general_solution(Pair.either_is_contained, source)
 
 
-def part2() -> int:
-    return _general_solution(Pair.are_overlapping)
+def part2(source: Optional[InputSource] = None) -> int:
+    return _general_solution(Pair.are_overlapping, source)
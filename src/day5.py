@@ -1,3 +1,6 @@
+from inputs import open_input
+
+
 def read_input(data):
     lines = data.readlines()
     indices_idx = lines.index("\n") - 1
@@ -26,8 +29,8 @@ def read_input(data):
     return stacks, instructions
 
 
-def part1():
-    with open("data/day5.txt", "r", encoding="utf-8") as data:
+def part1(source=None):
+    with open_input(5, source) as data:
         stacks, instructions = read_input(data)
 
         for instruction in instructions:
@@ -45,8 +48,8 @@ def part1():
         return result
 
 
-def part2():
-    with open("data/day5.txt", "r", encoding="utf-8") as data:
+def part2(source=None):
+    with open_input(5, source) as data:
         stacks, instructions = read_input(data)
 
         for instruction in instructions:
@@ -1,25 +1,46 @@
-def _all_different(string: str) -> bool:
-    length = len(string)
-    return all(
-        string[i] != string[j] for i in range(length) for j in range(i + 1, length)
-    )
+from typing import Iterable, Iterator, TextIO
 
+from inputs import open_input
 
-def _general_solution(pattern_len):
-    with open("data/day6.txt", "r", encoding="utf-8") as data:
-        text = data.read()
-        length = len(text)
+CHUNK_SIZE = 1 << 16
 
-        for i in range(length - pattern_len):
-            if _all_different(text[i : i + pattern_len]):
-                return i + pattern_len
 
-        raise ValueError("No solution found")
+def find_markers(chunks: Iterable[bytes], pattern_len: int) -> Iterator[int]:
+    # last position of every byte value; the current window of distinct bytes
+    # starts right after the latest repeat, so each byte is looked at once
+    last_seen = [-1] * 256
+    window_start = 0
+    pos = 0
 
+    for chunk in chunks:
+        for byte in chunk:
+            if last_seen[byte] >= window_start:
+                window_start = last_seen[byte] + 1
+            last_seen[byte] = pos
+            pos += 1
 
-def part1():
-    return _general_solution(4)
+            if pos - window_start >= pattern_len:
+                yield pos
 
 
-def part2():
-    return _general_solution(14)
+def read_chunks(data: TextIO) -> Iterator[bytes]:
+    while chunk := data.read(CHUNK_SIZE):
+        yield chunk.encode()
+
+
+def _general_solution(pattern_len, source):
+    with open_input(6, source) as data:
+        marker = next(find_markers(read_chunks(data), pattern_len), None)
+
+        if marker is None:
+            raise ValueError("No solution found")
+
+        return marker
+
+
+def part1(source=None):
+    return _general_solution(4, source)
+
+
+def part2(source=None):
+    return _general_solution(14, source)
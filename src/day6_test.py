@@ -7,3 +7,11 @@ def test_part1() -> None:
 
 def test_part2() -> None:
     assert day6.part2() == 2789
+
+
+def test_find_markers() -> None:
+    signal = b"mjqjpqmgbljsphdztnvjfqwrcgsmlb"
+    chunks = [signal[i : i + 5] for i in range(0, len(signal), 5)]
+    assert next(day6.find_markers(chunks, 4)) == 7
+    assert next(day6.find_markers([signal], 14)) == 19
+    assert list(day6.find_markers([b"abcabd"], 3)) == [3, 4, 5, 6]
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from inputs import open_input
+
 
 class Node(ABC):
     @abstractmethod
@@ -86,8 +88,8 @@ def sum_tree_with_limit(node, limit, result):
     return result
 
 
-def part1():
-    with open("data/day7.txt", "r", encoding="utf-8") as data:
+def part1(source=None):
+    with open_input(7, source) as data:
         lines = data.readlines()
         root = read_the_tree(lines)
 
@@ -106,8 +108,8 @@ def search_for_minimum_bigger_than(node, limit, result):
     return result
 
 
-def part2():
-    with open("data/day7.txt", "r", encoding="utf-8") as data:
+def part2(source=None):
+    with open_input(7, source) as data:
         lines = data.readlines()
         root = read_the_tree(lines)
 
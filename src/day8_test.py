@@ -7,3 +7,11 @@ def test_part1() -> None:
 
 def test_part2() -> None:
     assert day8.part2() == 383520
+
+
+def test_example() -> None:
+    forest = day8.read_the_forest(
+        ["30373\n", "25512\n", "65332\n", "33549\n", "35390\n"]
+    )
+    assert day8.count_visible(forest) == 21
+    assert day8.max_scenic_score(forest) == 8
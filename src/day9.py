@@ -1,4 +1,6 @@
-from typing import Set, Tuple
+from typing import Optional, Set, Tuple
+
+from inputs import InputSource, open_input
 
 
 def max_dist(x0: int, y0: int, x1: int, y1: int) -> int:
@@ -31,8 +33,8 @@ def move_tail(h_x: int, h_y: int, t_x: int, t_y: int) -> Tuple[int, int]:
     return t_x, t_y
 
 
-def part1() -> int:
-    with open("data/day9.txt", "r", encoding="utf-8") as data:
+def part1(source: Optional[InputSource] = None) -> int:
+    with open_input(9, source) as data:
         h_x, h_y = 0, 0
         t_x, t_y = 0, 0
         visited: Set[Tuple[int, int]] = {(0, 0)}
@@ -55,8 +57,8 @@ def part1() -> int:
 K = 10
 
 
-def part2() -> int:
-    with open("data/day9.txt", "r", encoding="utf-8") as data:
+def part2(source: Optional[InputSource] = None) -> int:
+    with open_input(9, source) as data:
         x = [0] * K
         y = [0] * K
         visited: Set[Tuple[int, int]] = {(0, 0)}
@@ -0,0 +1,133 @@
+import io
+import mmap
+import os
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import ContextManager, Iterable, Iterator, Optional, TextIO, Union
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+PathLike = Union[str, os.PathLike]
+
+
+# raw stream over a buffer, bytes are copied straight from the view
+class _MemoryReader(io.RawIOBase):
+    def __init__(self, view: memoryview):
+        super().__init__()
+        self._view = view
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        with self._view[self._pos : self._pos + len(buffer)] as chunk:
+            size = len(chunk)
+            buffer[:size] = chunk
+        self._pos += size
+        return size
+
+
+# raw stream encoding lines lazily from an iterable such as sys.stdin
+class _LineEncoder(io.RawIOBase):
+    def __init__(self, lines: Iterable[str]):
+        super().__init__()
+        self._lines = iter(lines)
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            line = next(self._lines, None)
+            if line is None:
+                return 0
+            self._pending = line.encode("utf-8")
+
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def _text_stream(raw: io.RawIOBase) -> TextIO:
+    return io.TextIOWrapper(io.BufferedReader(raw), encoding="utf-8")
+
+
+# sources are deliberately tiny: open() is their whole interface
+# pylint: disable=too-few-public-methods
+
+
+class InputSource(ABC):
+    @abstractmethod
+    def open(self) -> ContextManager[TextIO]:
+        pass
+
+
+class FileSource(InputSource):
+    def __init__(self, path: PathLike):
+        self.path = path
+
+    def open(self) -> ContextManager[TextIO]:
+        return open(self.path, "r", encoding="utf-8")
+
+
+class MmapSource(InputSource):
+    def __init__(self, path: PathLike):
+        self.path = path
+
+    @contextmanager
+    def _open(self) -> Iterator[TextIO]:
+        with open(self.path, "rb") as file:
+            # empty files cannot be mapped
+            if os.fstat(file.fileno()).st_size == 0:
+                yield io.StringIO()
+                return
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                # the view has to be released before the mapping is closed
+                with memoryview(mapped) as view:
+                    yield _text_stream(_MemoryReader(view))
+
+    def open(self) -> ContextManager[TextIO]:
+        return self._open()
+
+
+class BytesSource(InputSource):
+    def __init__(self, data: Union[bytes, bytearray, memoryview]):
+        self.data = data
+
+    @contextmanager
+    def _open(self) -> Iterator[TextIO]:
+        with memoryview(self.data) as view:
+            yield _text_stream(_MemoryReader(view))
+
+    def open(self) -> ContextManager[TextIO]:
+        return self._open()
+
+
+# single-use source, lines keep their terminators as in a text file
+class LineSource(InputSource):
+    def __init__(self, lines: Iterable[str]):
+        self.lines = lines
+
+    @contextmanager
+    def _open(self) -> Iterator[TextIO]:
+        yield _text_stream(_LineEncoder(self.lines))
+
+    def open(self) -> ContextManager[TextIO]:
+        return self._open()
+
+
+def default_source(day: int) -> InputSource:
+    return FileSource(DATA_DIR / f"day{day}.txt")
+
+
+def open_input(
+    day: int, source: Optional[InputSource] = None
+) -> ContextManager[TextIO]:
+    if source is None:
+        source = default_source(day)
+    return source.open()
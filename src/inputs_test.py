@@ -0,0 +1,31 @@
+import io
+
+import day1
+import day5
+import inputs
+from inputs import BytesSource, FileSource, LineSource, MmapSource
+
+
+def test_default_source() -> None:
+    assert day1.part1(inputs.default_source(1)) == 69289
+
+
+def test_file_backends() -> None:
+    path = inputs.DATA_DIR / "day5.txt"
+    assert day5.part1(FileSource(path)) == day5.part1()
+    assert day5.part2(MmapSource(path)) == day5.part2()
+
+
+def test_memory_backends() -> None:
+    text = (inputs.DATA_DIR / "day1.txt").read_text(encoding="utf-8")
+    assert day1.part2(BytesSource(text.encode())) == 205615
+    assert day1.part2(LineSource(io.StringIO(text))) == 205615
+
+
+def test_line_source_reads() -> None:
+    with LineSource(["ab\n", "cd\n", "ef"]).open() as data:
+        assert data.read(1) == "a"
+        assert data.readline() == "b\n"
+        assert data.read(4) == "cd\ne"
+        assert data.read() == "f"
+        assert data.read() == ""
@@ -0,0 +1,126 @@
+import argparse
+import importlib
+import re
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Iterable, Iterator, NamedTuple, Optional
+
+SRC_DIR = Path(__file__).resolve().parent
+DAY_PATTERN = re.compile(r"day(\d+)\.py")
+PART_PATTERN = re.compile(r"part(\d+)")
+
+
+class Task(NamedTuple):
+    day: int
+    part: int
+
+
+class Report(NamedTuple):
+    task: Task
+    answer: Any
+    seconds: float
+    error: Optional[str] = None
+
+
+# rough single-process wall times on the real inputs, slowest first;
+# everything not listed is assumed to finish in well under a second
+EXPECTED_SECONDS: dict[Task, float] = {
+    Task(24, 2): 270.0,
+    Task(24, 1): 90.0,
+    Task(23, 2): 50.0,
+    Task(20, 2): 1.0,
+    Task(22, 2): 0.7,
+    Task(19, 2): 0.3,
+    Task(23, 1): 0.3,
+    Task(20, 1): 0.1,
+}
+
+
+def available_days() -> list[int]:
+    days = []
+
+    for path in SRC_DIR.iterdir():
+        if match := DAY_PATTERN.fullmatch(path.name):
+            days.append(int(match.group(1)))
+
+    return sorted(days)
+
+
+def discover_tasks(days: Optional[Iterable[int]] = None) -> list[Task]:
+    tasks = []
+
+    for day in available_days() if days is None else days:
+        module = importlib.import_module(f"day{day}")
+
+        for name in dir(module):
+            if (match := PART_PATTERN.fullmatch(name)) and callable(
+                getattr(module, name)
+            ):
+                tasks.append(Task(day, int(match.group(1))))
+
+    return sorted(tasks)
+
+
+def schedule(tasks: Iterable[Task]) -> list[Task]:
+    # longest processing time first: the long tasks start immediately and the
+    # short ones fill the gaps, so the total is close to the slowest task
+    return sorted(tasks, key=lambda task: -EXPECTED_SECONDS.get(task, 0.0))
+
+
+def run_task(task: Task) -> Report:
+    module = importlib.import_module(f"day{task.day}")
+    solve = getattr(module, f"part{task.part}")
+
+    start = time.perf_counter()
+    answer = solve()
+
+    return Report(task, answer, time.perf_counter() - start)
+
+
+def collect_report(task: Task, future: "Future[Report]") -> Report:
+    if (error := future.exception()) is not None:
+        return Report(task, None, 0.0, f"{type(error).__name__}: {error}")
+    return future.result()
+
+
+def run_all(
+    tasks: Iterable[Task], workers: Optional[int] = None
+) -> Iterator[Report]:
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(run_task, task): task for task in schedule(tasks)}
+
+        for future in as_completed(futures):
+            yield collect_report(futures[future], future)
+
+
+def format_report(report: Report) -> str:
+    name = f"day{report.task.day:<2} part{report.task.part}"
+
+    if report.error is not None:
+        return f"{name}  failed: {report.error}"
+
+    answer = str(report.answer).strip()
+    if "\n" in answer:
+        answer = "\n" + answer
+
+    return f"{name}  {report.seconds:8.3f}s  {answer}"
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run all Advent of Code solutions.")
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default: all)")
+    parser.add_argument("-j", "--workers", type=int, help="number of worker processes")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    tasks = discover_tasks(args.days or None)
+
+    for report in run_all(tasks, args.workers):
+        print(format_report(report), flush=True)
+
+    print(f"total {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
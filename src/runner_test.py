@@ -0,0 +1,20 @@
+import runner
+from runner import Task
+
+
+def test_discover_tasks() -> None:
+    tasks = runner.discover_tasks()
+    assert Task(1, 1) in tasks
+    assert Task(25, 1) in tasks
+    assert Task(25, 2) not in tasks
+
+
+def test_schedule() -> None:
+    ordered = runner.schedule([Task(1, 1), Task(19, 2), Task(24, 1)])
+    assert ordered == [Task(24, 1), Task(19, 2), Task(1, 1)]
+
+
+def test_run_all() -> None:
+    reports = runner.run_all([Task(1, 1), Task(6, 2)], workers=2)
+    answers = {report.task: report.answer for report in reports}
+    assert answers == {Task(1, 1): 69289, Task(6, 2): 2789}